@@ -46,7 +46,7 @@ sdl_version: str = f"{pygame.version.SDL[0]}.{pygame.version.SDL[1]}.{pygame.ver
 # pymunk_version: str = pymunk.version
 """pymunk version"""
 
-from .wrapper import vector, rect, Shape,Rect,Circle, Text, Image, Music, SoundEffect
+from .wrapper import vector, rect, Shape,Rect,Circle, Text, Image, Tilemap, ShapeArray, SpriteArray, Particles, Music, SoundEffect, VoicePool
 from .utils import asyncio,engine
 
 # (Not ready)
@@ -54,4 +54,5 @@ from .utils import asyncio,engine
 from .assets import Assets
 from .display import Display
 from .camera import Camera
+from .spatial import SpatialHash
 from .scene import Scene
@@ -97,6 +97,7 @@ def main():
     parser_build = subparsers.add_parser("build",aliases=["make","compile"], help="Build the project")
     parser_build.add_argument("name", help="The name of the project to build")
     parser_build.add_argument("--web","-w", action="store_true",help="Use the web builder")
+    parser_build.add_argument("--no-pack", action="store_true",help="Copy the asset files instead of packing them")
     parser_build.set_defaults(func=build_project)
 
     # info
@@ -1,22 +1,195 @@
-from .utils import engine,python
-
+from .utils import engine,python,cache,is_web
+from .manifest import Manifest
+from .atlas import TextureAtlas
+from .pack import Pack
+from .pixels import PixelCache
+from .watcher import FileWatcher
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from importlib.util import cache_from_source
+from collections import OrderedDict,deque
 from dataclasses import dataclass, field
-from typing import Any,Optional
+from hashlib import blake2b
+from typing import Any,Iterable
+from weakref import WeakKeyDictionary,WeakSet
+from math import log2
+from time import perf_counter
 import os
 
 import pygame
 
+def _read_image(path: str) -> pygame.Surface:
+    """@private Reads and decodes an image file."""
+    return pygame.image.load(Pack.get_file(path, True), path)
+
 loaders = {
-    "images":lambda path:pygame.image.load(path).convert_alpha(),
+    "images":lambda path:finishers["images"](decoders["images"](path)),
     "music": lambda path:path,  # pygame.music loads only the last music file
-    "sfx":lambda path:pygame.mixer.Sound(path),
-    "fonts": lambda path: {size: pygame.font.Font(path, size) for size in
-        {1, 2, 4, 8, 10, 12, 14, 16, 18, 24, 32, 48, 64, 72, 96, 128, 144, 192, 256}},
+    "sfx":lambda path:pygame.mixer.Sound(Pack.get_file(path,True)),
+    "fonts": lambda path: Font(path),
     "scenes": lambda path: python.load_class(path,python.get_filename(path).title().replace(" ", "_")),
     "scripts": lambda path: python.load_class(path,python.get_filename(path).title().replace(" ", "_"))
 }
 """@private The loaders dictionary"""
 
+decoders = {
+    "images": lambda path: Assets._pixels.decode(path, _read_image) if Assets._pixels is not None else _read_image(path),
+    "sfx": lambda path: pygame.mixer.Sound(Pack.get_file(path, True)),
+}
+"""@private The parts of the loaders that can run in a background thread (reading and decoding the files)"""
+
+finishers = {
+    "images": lambda decoded: Assets._pixels.finish(decoded) if Assets._pixels is not None else decoded.convert_alpha(),
+    "sfx": lambda sound: sound,
+}
+"""@private The parts of the loaders that must run on the main thread, after the decoders"""
+
+class Font:
+    """
+    A font file, with its sizes loaded on first use.
+
+    Any size can be used, every size is a `pygame.font.Font` created once and then cached.
+    """
+
+    _system_paths: dict[str, str | None] | None = None
+    """@private The resolved system font paths, persisted in the engine cache"""
+
+    def __init__(self, path: str | None) -> None:
+        """
+        Initialize a lazy font.
+
+        Args:
+            path (str | None): The path of the font file, None for the pygame default font.
+        """
+        self._path = path
+        self._sizes: dict[int, pygame.font.Font] = {}
+
+    def __repr__(self) -> str:
+        return f"<Font | path: {self._path}, sizes: {sorted(self._sizes)}>"
+
+    def __getitem__(self, size: int) -> pygame.font.Font:
+        return self.get(size)
+
+    def __contains__(self, size: int) -> bool:
+        return size in self._sizes
+
+    @classmethod
+    def sys(cls, name: str) -> "Font":
+        """
+        Create a lazy font from a system font name.
+
+        The font path is resolved once and saved in the engine cache,
+        so the next runs skip the system font scan.
+
+        Args:
+            name (str): The system font name.
+
+        Returns:
+            Font: The font, with the pygame default font if the name is not found.
+        """
+        paths = cls._system_paths
+        if paths is None:
+            paths = cls._system_paths = cache.load_cache("fonts")
+
+        path = paths.get(name, "")
+        if path == "" or (path is not None and not os.path.isfile(path)):
+            path = paths[name] = pygame.font.match_font(name)  # scans the system fonts
+            cache.save_cache("fonts", paths)
+
+        return cls(path)
+
+    @property
+    def path(self) -> str | None:
+        """The path of the font file, None for the pygame default font."""
+        return self._path
+
+    @property
+    def sizes(self) -> list[int]:
+        """The sizes that have been loaded."""
+        return sorted(self._sizes)
+
+    def get(self, size: int) -> pygame.font.Font:
+        """
+        Get the font of a size, loading it on first use.
+
+        Args:
+            size (int): The font size.
+
+        Returns:
+            pygame.font.Font: The font object.
+        """
+        font = self._sizes.get(size)
+        if font is None:
+            # every size reads its own file object, a packed font is read while rendering
+            font = self._sizes[size] = pygame.font.Font(self._path and Pack.get_file(self._path), size)
+        return font
+
+
+class AssetStore(dict):
+    """
+    The loaded assets of a category, by name.
+
+    A missing asset with a known file is loaded on first access and kept,
+    so only the assets that are used are ever decoded.
+    """
+
+    def __init__(self, data: "Data", category: str) -> None:
+        """
+        Initialize an empty asset store.
+
+        Args:
+            data (Data): The data structure with the file paths.
+            category (str): The asset category, e.g. "images".
+        """
+        super().__init__()
+        self._data = data
+        self._category = category
+
+    def __missing__(self, name: str) -> Any:
+        path = self._data.files.get(self._category, {}).get(name)
+        if path is None:
+            raise KeyError(name)
+        return self.load(name, path)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Get an asset, loading it on first access.
+
+        Args:
+            name (str): The asset name.
+            default (Any): The value to return if there is no such asset. Defaults to None.
+
+        Returns:
+            Any: The asset, or the default value.
+        """
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def load(self, name: str, path: str) -> Any:
+        """
+        Load an asset file and keep it, recording its load time.
+
+        Args:
+            name (str): The asset name.
+            path (str): The path of the asset file.
+
+        Returns:
+            Any: The loaded asset.
+        """
+        start = perf_counter()
+        asset = loaders[self._category](path)
+        self._store(name, asset, perf_counter() - start)
+        return asset
+
+    def _store(self, name: str, asset: Any, elapsed: float) -> None:
+        """Keeps a loaded asset and its load time."""
+        self[name] = asset
+        self._data.load_times[f"{self._category}/{name}"] = elapsed
+
+
 @dataclass
 class Data:
     """The Data structure"""
@@ -27,6 +200,12 @@ class Data:
     scripts: dict[str, Any] = field(default_factory=dict)
     music: dict[str, Any] = field(default_factory=dict)
     sfx: dict[str, Any] = field(default_factory=dict)
+    load_times: dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # the asset categories load their files on first access
+        for category in loaders:
+            setattr(self, category, AssetStore(self, category))
 
     def __repr__(self) -> str:
         return (
@@ -39,11 +218,92 @@ class Data:
             f"sfx: {len(self.sfx)}>"
         )
 
+class LoadHandle:
+    """
+    The progress of a background asset load, returned by `Assets.load_async`.
+
+    Example:
+        handle = Assets.load_async(["images", "sfx/jump"])
+        ...
+        if handle.done:
+            self.manager.change("level")
+    """
+
+    def __init__(self, total: int) -> None:
+        """
+        Initialize the progress of a load.
+
+        Args:
+            total (int): The number of assets to load.
+        """
+        self._total = total
+        self._loaded = 0
+        self._errors: list[tuple[str, Exception]] = []
+
+    def __repr__(self) -> str:
+        return f"<LoadHandle | loaded: {self._loaded}/{self._total}, errors: {len(self._errors)}>"
+
+    @property
+    def total(self) -> int:
+        """The number of assets to load."""
+        return self._total
+
+    @property
+    def loaded(self) -> int:
+        """The number of assets finished (loaded or failed)."""
+        return self._loaded
+
+    @property
+    def progress(self) -> float:
+        """The finished part of the load, from 0 to 1."""
+        return self._loaded / self._total if self._total else 1
+
+    @property
+    def done(self) -> bool:
+        """Whether every asset is finished."""
+        return self._loaded >= self._total
+
+    @property
+    def errors(self) -> list[tuple[str, Exception]]:
+        """The ("category/name", error) of the assets that failed to load."""
+        return list(self._errors)
+
+
 class Assets:
     data = Data()
     """@private The game data"""
     engine = Data()
     """@private The Engine data"""
+    _mipmaps: WeakKeyDictionary = WeakKeyDictionary()
+    """@private The power of two levels of every source surface, shared by all the users of that surface"""
+    _mipmap_levels = 3  # the cached levels on each side of 1 (the camera max zoom factor)
+    _scaled: OrderedDict = OrderedDict()
+    """@private The recently used other scales (least recently used first), by (surface, scale)"""
+    _scaled_limit = 256
+    _loading: deque = deque()
+    """@private The background loads waiting to be finished on the main thread"""
+    _executor: ThreadPoolExecutor | None = None
+    """@private The background loading threads, started on the first async load"""
+    _load_budget = 0.002  # the main thread time per frame for finishing background loads (in seconds)
+    _atlases: dict[str, TextureAtlas] = {}
+    """@private The texture atlas of every data source"""
+    _manifests: dict[str, Manifest] = {}
+    """@private The asset manifest of every root directory"""
+    _pixels: PixelCache | None = None
+    """@private The decoded images cache of the game data, if it is enabled"""
+    _refs: dict[Any, dict[str, int]] = {}
+    """@private The acquired game assets of every owner (e.g. a scene), as {"category/name": count}"""
+    _cold: dict[str, None] = {}
+    """@private The released game assets that no owner references anymore, the coldest first"""
+    _memory_budget: int | None = None
+    """@private The resident bytes to keep the unreferenced assets for, None to unload them right away"""
+    _unloadable = ("images", "fonts", "sfx")  # the categories that hold memory (scenes and scripts are never unloaded)
+    _paths: dict[str, str] = {}
+    """@private The directory of every game asset category"""
+    _watcher: FileWatcher | None = None
+    """@private The file watcher of the game asset directories, if hot-reload is enabled"""
+    _images: WeakSet = WeakSet()
+    """@private The `Image` objects, tracked only while hot-reloading so a resized image can be swapped in them"""
 
     @classmethod
     def init(
@@ -51,7 +311,8 @@ class Assets:
         path_images: str = None,path_fonts: str = None,
         path_scenes: str = None,path_scripts: str = None,
         path_music: str = None,path_sfx: str = None,
-        pre_load: bool = True
+        pre_load: bool = True,atlas: bool = False,
+        pixel_cache: bool = False,watch: bool = False
     ) -> None:
         """
         Initialize the Assets system by loading asset files into the Data structure.
@@ -64,6 +325,12 @@ class Assets:
             path_music (str, optional): Path to song files.
             path_sfx (str, optional): Path to sound effect files.
             pre_load (bool): Whether to preload the assets immediately. Defaults to True.
+                Otherwise every asset is loaded on its first `Assets.get`.
+            atlas (bool): Whether to pack the small loaded images into texture atlas pages, see `Assets.build_atlas`. Defaults to False.
+            pixel_cache (bool): Whether to keep the decoded images in a persistent cache,
+                so the next runs skip the image decoding, see `PixelCache`. Defaults to False.
+            watch (bool): Whether to reload the changed files while the game runs (for development). Defaults to False.
+                The running scenes pick up the new images, sounds, fonts and scene code on the next frame.
         """
         cls._load_engine_files()
         cls.load("engine")  # always load the engine data
@@ -74,7 +341,12 @@ class Assets:
             path_scenes,path_scripts,
             path_music,path_sfx
         )
+        pixel_cache and cls.__init_pixel_cache(os.getcwd())
         pre_load and cls.load("data")
+        cls._pixels is not None and cls._pixels.save()
+        atlas and cls.build_atlas("data")
+        if watch:
+            cls._watcher = FileWatcher(cls._paths.values())
 
     @classmethod
     def get(cls,source: str, *loc) -> Any:
@@ -112,6 +384,388 @@ class Assets:
 
         return data
 
+    @classmethod
+    def get_scaled(cls, surface: pygame.Surface, scale: float) -> pygame.Surface:
+        """
+        Get a scaled variant of a surface from its mipmap pyramid.
+
+        The power of two levels inside the camera zoom range (see `Camera.set_max_zoom`) are built once
+        on first use and shared by every object that draws the same surface, so zooming the camera
+        by whole steps costs no transforms after the first time. Downscales are built from the previous level.
+        Any other scale (e.g. a smooth zoom) is kept in a small shared LRU cache instead,
+        so a zoom animation does not keep a variant of every frame.
+
+        Args:
+            surface (pygame.Surface): The source surface.
+            scale (float): The scale factor.
+
+        Returns:
+            pygame.Surface: The scaled surface.
+        """
+        if scale == 1:
+            return surface
+
+        factor = log2(scale)
+        if not factor.is_integer() or abs(factor) > cls._mipmap_levels:
+            return cls.__get_scaled_other(surface, scale)
+
+        levels = cls._mipmaps.get(surface)
+        if levels is None:
+            levels = cls._mipmaps[surface] = {}
+
+        scaled = levels.get(scale)
+        if scaled is None:
+            if factor < 0:
+                scaled = pygame.transform.smoothscale_by(cls.get_scaled(surface, scale * 2), 0.5)
+            else:
+                scaled = pygame.transform.smoothscale_by(surface, scale)
+            levels[scale] = scaled
+
+        return scaled
+
+    @classmethod
+    def __get_scaled_other(cls, surface: pygame.Surface, scale: float) -> pygame.Surface:
+        """Returns a scale outside the pyramid from the LRU cache, scaling it on a miss."""
+        key = (surface, scale)
+        scaled = cls._scaled.get(key)
+        if scaled is not None:
+            cls._scaled.move_to_end(key)
+            return scaled
+
+        scaled = cls._scaled[key] = pygame.transform.smoothscale_by(surface, scale)
+        len(cls._scaled) > cls._scaled_limit and cls._scaled.popitem(last=False)
+        return scaled
+
+    @classmethod
+    def __drop_scaled(cls, surface: pygame.Surface) -> None:
+        """Removes the cached other scales of a surface (the pyramid levels are weakly referenced)."""
+        for key in [key for key in cls._scaled if key[0] is surface]:
+            del cls._scaled[key]
+
+    @classmethod
+    def build_atlas(cls, source: str = "data", max_image: int = 256, max_size: int = 2048, padding: int = 1, names: Iterable[str] | None = None) -> TextureAtlas:
+        """
+        Pack the small images of a source into texture atlas pages.
+
+        After packing, `Assets.get(source, "images", name)` returns a zero-copy subsurface view into a page,
+        so the images share a few allocations and can be batched from one source surface.
+        The layout is cached, so only the first run pays for the packing.
+        Only the loaded images are packed by default, so the lazy loading (`pre_load=False`) is kept,
+        named images are loaded if needed.
+
+        Args:
+            source (str): The data name. Defaults to "data".
+            max_image (int): The largest width or height of an image to pack, larger images stay separate. Defaults to 256.
+            max_size (int): The maximum width and height of a page. Defaults to 2048.
+            padding (int): The empty pixels around every image. Defaults to 1.
+            names (Iterable[str], optional): The names of the images to pack. Defaults to the loaded images.
+
+        Returns:
+            TextureAtlas: The atlas of the source.
+        """
+        store = getattr(cls, source).images
+        small = {}
+        for name in list(store) if names is None else names:
+            surface = store.get(name)
+            if surface is not None and max(surface.get_size()) <= max_image:
+                small[name] = surface
+
+        atlas = cls._atlases[source] = TextureAtlas.build(small, max_size, padding)
+        for name in small:
+            store[name] = atlas.get(name)
+        return atlas
+
+    @classmethod
+    def get_atlas(cls, source: str = "data") -> TextureAtlas | None:
+        """
+        Get the texture atlas of a source.
+
+        Args:
+            source (str): The data name. Defaults to "data".
+
+        Returns:
+            TextureAtlas | None: The atlas, or None if it was not built.
+        """
+        return cls._atlases.get(source)
+
+    @classmethod
+    def load_async(cls, names: Iterable[str] | None = None, source: str = "data", workers: int = 4) -> LoadHandle:
+        """
+        Load assets in the background while the scene loop keeps running.
+
+        The files are read and decoded in background threads, then the scene loop finishes them
+        on the main thread (like `convert_alpha`) in small slices every frame.
+        Use the returned handle for a loading screen, or to prefetch the next level.
+
+        Args:
+            names (Iterable[str], optional): The assets to load, as "category/name" or a whole "category".
+                Defaults to every file of the source.
+            source (str): The data name to load to. Defaults to "data".
+            workers (int): The number of background threads, used when they are first started. Defaults to 4.
+
+        Returns:
+            LoadHandle: The progress of the load.
+
+        Example:
+            handle = Assets.load_async(["images/player", "sfx"])
+        """
+        data = getattr(cls, source)
+        jobs = []
+        for category, name in cls.__resolve_names(data, names):
+            store = getattr(data, category)
+            if name not in store:
+                jobs.append((category, name, data.files[category][name]))
+
+        handle = LoadHandle(len(jobs))
+        threads = not is_web()  # no threads on the web, everything is done in the frame slices
+        if threads and cls._executor is None and jobs:
+            cls._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pyxora-assets")
+
+        for category, name, path in jobs:
+            decoder = decoders.get(category)
+            future = cls._executor.submit(cls.__decode, decoder, path) if threads and decoder else None
+            cls._loading.append((handle, getattr(data, category), name, path, future))
+        return handle
+
+    @classmethod
+    def _update_loading(cls) -> None:
+        """
+        Finish the background loads on the main thread, for at most the load budget.
+        (called by the scene loop every frame)
+        """
+        loading = cls._loading
+        start = perf_counter()
+        while loading and perf_counter() - start < cls._load_budget:
+            handle, store, name, path, future = loading[0]
+            if name in store:
+                # loaded on access while it was queued, a second object would not reach the existing references
+                loading.popleft()
+                future is not None and future.cancel()
+                handle._loaded += 1
+                continue
+            if future is not None and not future.done():
+                return  # still decoding, try again next frame
+            loading.popleft()
+
+            category = store._category
+            try:
+                if future is None:
+                    begin = perf_counter()
+                    asset, elapsed = loaders[category](path), 0
+                else:
+                    decoded, elapsed = future.result()
+                    begin = perf_counter()
+                    asset = finishers[category](decoded)
+                store._store(name, asset, elapsed + perf_counter() - begin)
+            except Exception as e:
+                handle._errors.append((f"{category}/{name}", e))
+                engine.warning(f"Failed to load {category}/{name}: {e}")
+            handle._loaded += 1
+
+        if not loading and cls._pixels is not None:
+            cls._pixels.save()
+
+    @classmethod
+    def _update_watcher(cls) -> list[tuple[Any, Any]]:
+        """
+        Reload the changed game files (called by the scene loop every frame).
+
+        An image of the same size is updated in place (with its scaled variants), so every object
+        that draws it shows the new pixels. A resized image is replaced in the data and in every `Image`
+        made from it (keeping their top-left position and custom size). Fonts drop their loaded sizes. The other assets
+        are replaced in the data, the objects created before keep the old one.
+        New files are added and loaded on first access, deleted files are removed from the files.
+
+        Returns:
+            list[tuple[Any, Any]]: The (old, new) asset of every reloaded asset.
+        """
+        reloaded = []
+        for path in cls._watcher.poll():
+            found = cls.__find_file(path)
+            if found is None:
+                continue
+            category, name = found
+            files = cls.data.files.setdefault(category, {})
+            store = getattr(cls.data, category)
+            if not os.path.isfile(path):
+                files.pop(name, None)
+                continue
+            files[name] = path
+            if name not in store:
+                continue  # not loaded yet
+
+            old = store[name]
+            try:
+                if category in ("scenes", "scripts"):
+                    # the bytecode cache is checked by mtime in seconds and size, a quick edit can look unchanged
+                    with suppress(OSError):
+                        os.remove(cache_from_source(path))
+                new = loaders[category](path)
+            except Exception as e:  # e.g. a half saved file or a syntax error, keep the old one
+                engine.warning(f"Failed to reload {category}/{name}: {e}")
+                continue
+
+            if category == "images" and new.get_size() == old.get_size():
+                cls.__copy_pixels(new, old)
+                for scale, scaled in cls._mipmaps.get(old, {}).items():
+                    cls.__copy_pixels(pygame.transform.smoothscale_by(old, scale), scaled)
+                cls.__drop_scaled(old)
+                new = old
+            elif category == "fonts":
+                old._sizes.clear()
+                new = old
+            else:
+                store[name] = new
+                category == "images" and cls.__drop_scaled(old)
+            if category == "images":
+                # the images with a custom size draw a scaled copy, it is scaled again even if the pixels changed in place
+                for image in list(cls._images):
+                    image._source is old and (new is not old or image._surface is not old) and image._set_surface(new)
+            reloaded.append((old, new))
+        return reloaded
+
+    @classmethod
+    def get_load_times(cls, source: str = "data") -> dict[str, float]:
+        """
+        Get the load time of every loaded asset, slowest first.
+
+        Args:
+            source (str): The data name. Defaults to "data".
+
+        Returns:
+            dict[str, float]: The load time in seconds by "category/name".
+        """
+        times = getattr(cls, source).load_times
+        return dict(sorted(times.items(), key=lambda item: item[1], reverse=True))
+
+    @classmethod
+    def acquire(cls, owner: Any, names: Iterable[str]) -> None:
+        """
+        Reference game assets from an owner, so they are kept while the owner uses them.
+
+        The assets are still loaded on first access, use `Assets.load_async` to prefetch them.
+        Scenes acquire their `Scene.uses` assets when they are created.
+
+        Args:
+            owner (Any): The owner of the references, e.g. a scene.
+            names (Iterable[str]): The assets, as "category/name" or a whole "category".
+        """
+        refs = cls._refs.setdefault(owner, {})
+        for category, name in cls.__resolve_names(cls.data, names):
+            key = f"{category}/{name}"
+            refs[key] = refs.get(key, 0) + 1
+            cls._cold.pop(key, None)
+
+    @classmethod
+    def release(cls, owner: Any, names: Iterable[str] | None = None) -> int:
+        """
+        Drop the references of an owner and unload the assets no owner references anymore, see `Assets.collect`.
+
+        Scenes release their assets on `SceneManager.change`.
+
+        Args:
+            owner (Any): The owner of the references.
+            names (Iterable[str], optional): The assets to release once, as "category/name" or a whole "category".
+                Defaults to every asset of the owner.
+
+        Returns:
+            int: The bytes that were freed.
+        """
+        refs = cls._refs.get(owner)
+        if refs is None:
+            return 0
+
+        if names is None:
+            released = list(refs)
+            del cls._refs[owner]
+        else:
+            released = []
+            for category, name in cls.__resolve_names(cls.data, names):
+                key = f"{category}/{name}"
+                count = refs.get(key, 0) - 1
+                if count > 0:
+                    refs[key] = count
+                elif refs.pop(key, None) is not None:
+                    released.append(key)
+
+        for key in released:
+            if not any(key in other for other in cls._refs.values()):
+                cls._cold[key] = None
+        return cls.collect()
+
+    @classmethod
+    def collect(cls) -> int:
+        """
+        Unload the released game assets no owner references.
+
+        Without a memory budget the released assets are unloaded right away.
+        With a budget they are kept for a quick return (e.g. to the previous level) until the
+        resident bytes go over the budget, then they are unloaded in release order.
+        Only the assets a scene released are unloaded, the ones that were never acquired
+        may still be used by objects that hold them. An unloaded asset is loaded again on its next access.
+
+        Returns:
+            int: The bytes that were freed.
+        """
+        data = cls.data
+        budget = cls._memory_budget
+        if budget is None:
+            victims = list(cls._cold)
+        else:
+            resident = sum(cls.get_memory().values())
+            if resident <= budget:
+                return 0
+            victims = []
+            for key in cls._cold:
+                if resident <= budget:
+                    break
+                category, _, name = key.partition("/")
+                resident -= cls.__get_asset_memory(dict.get(getattr(data, category), name))  # without loading it
+                victims.append(key)
+
+        freed = 0
+        for key in victims:
+            cls._cold.pop(key, None)
+            category, _, name = key.partition("/")
+            if category in cls._unloadable:
+                asset = getattr(data, category).pop(name, None)
+                category == "images" and cls.__drop_scaled(asset)
+                freed += cls.__get_asset_memory(asset)
+        return freed
+
+    @classmethod
+    def set_memory_budget(cls, budget: int | None) -> None:
+        """
+        Set the memory budget of the released game assets, see `Assets.collect`.
+
+        Args:
+            budget (int | None): The resident bytes of the game assets to keep the released assets for,
+                None to unload them as soon as they are released (the default).
+        """
+        cls._memory_budget = budget
+        cls.collect()
+
+    @classmethod
+    def get_memory(cls, source: str = "data") -> dict[str, int]:
+        """
+        Get the resident bytes of the loaded assets, by category.
+
+        The images are counted by their pixels (a texture atlas page once), the sounds by their samples,
+        and the fonts by their file size for every loaded size.
+
+        Args:
+            source (str): The data name. Defaults to "data".
+
+        Returns:
+            dict[str, int]: The resident bytes of the "images", "fonts" and "sfx".
+        """
+        data = getattr(cls, source)
+        memory = {}
+        for category in cls._unloadable:
+            seen = set()
+            memory[category] = sum(cls.__get_asset_memory(asset, seen) for asset in getattr(data, category).values())
+        return memory
+
     @classmethod
     def load(cls, source: "str") -> None:
         """
@@ -122,14 +776,14 @@ class Assets:
         """
 
         data = getattr(cls, source)
-        for category, loader in loaders.items():
+        for category in loaders:
             file_dict = data.files.get(category)
             if not file_dict:
                 continue
 
             asset_store = getattr(data, category)
             for name, path in file_dict.items():
-                asset_store[name] = loader(path)
+                asset_store.load(name, path)
 
     @classmethod
     def _load_data_files(cls, path_images: str,path_fonts: str, path_scenes: str,path_scripts: str, path_music: str,path_sfx: str) -> None:
@@ -165,7 +819,8 @@ class Assets:
         if path_scripts is not None:
             paths["scripts"] = cls.__get_full_path(path_scripts)
 
-        cls.data.files = cls.__get_all_files(paths)
+        cls._paths = paths
+        cls.data.files = cls.__get_all_files(paths,os.getcwd())
 
     @classmethod
     def _load_engine_files(cls) -> None:
@@ -178,42 +833,125 @@ class Assets:
             # Like basic build-in scripts to speed up development
         }
 
-        cls.engine.files = cls.__get_all_files(paths)
+        cls.engine.files = cls.__get_all_files(paths,base)
+
+    @classmethod
+    def __init_pixel_cache(cls, root: str) -> None:
+        """Enables the decoded images cache of a root directory, keyed by the file hashes of its pack or manifest."""
+        manifest = cls._manifests[root]
+        hasher = lambda path: (Pack.get_record(path) or manifest.get(path) or {}).get("hash")
+        cls._pixels = PixelCache(
+            f"pixels-{blake2b(root.encode(), digest_size=8).hexdigest()}",
+            hasher,
+            lambda: (hasher(path) for path in cls.data.files.get("images", {}).values())
+        )
+
+    @classmethod
+    def __find_file(cls, path: str) -> tuple[str, str] | None:
+        """Returns the (category, name) of a game file path, or None if it is not an asset file."""
+        for category, directory in cls._paths.items():
+            if not path.startswith(directory) or path[len(directory):len(directory) + 1] != os.sep:
+                continue
+            name = path[len(directory) + 1:].replace(os.sep, "/")
+            base = name.rpartition("/")[2]
+            if base.startswith(".") or base.endswith("~") or "__pycache__" in name:
+                return None  # editor and cache files
+            if category in ("scenes", "scripts") and not base.endswith(".py"):
+                return None
+            dot = base.rfind(".")
+            return category, (name[:len(name) - len(base) + dot] if dot > 0 else name)
+        return None
+
+    @staticmethod
+    def __copy_pixels(source: pygame.Surface, target: pygame.Surface) -> None:
+        """Copies the pixels of a surface into another one of the same size, alpha included."""
+        target.fill((0, 0, 0, 0))
+        target.blit(source, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+    @staticmethod
+    def __decode(decoder, path: str) -> tuple[Any, float]:
+        """Decodes a file in a background thread, returns the result and the decode time."""
+        start = perf_counter()
+        return decoder(path), perf_counter() - start
+
+    @staticmethod
+    def __get_asset_memory(asset: Any, seen: set | None = None) -> int:
+        """Returns the resident bytes of an asset, the pages of subsurfaces are counted once in `seen` (or not at all)."""
+        if isinstance(asset, pygame.Surface):
+            parent = asset.get_abs_parent()
+            if parent is not asset:
+                if seen is None or id(parent) in seen:
+                    return 0
+                seen.add(id(parent))
+            return parent.get_width() * parent.get_height() * parent.get_bytesize()
+
+        if isinstance(asset, pygame.mixer.Sound):
+            mixer = pygame.mixer.get_init()
+            if not mixer:
+                return 0
+            frequency, size, channels = mixer
+            return int(asset.get_length() * frequency) * channels * abs(size) // 8
+
+        if isinstance(asset, Font) and asset.path is not None:
+            record = Pack.get_record(asset.path)
+            try:
+                size = record["size"] if record else os.path.getsize(asset.path)
+            except OSError:
+                return 0
+            return size * len(asset.sizes)
+        return 0
 
     @staticmethod
-    def __get_default_font() -> dict[str, dict[int, pygame.font.Font]]:
+    def __resolve_names(data: Data, names: Iterable[str] | None) -> list[tuple[str, str]]:
+        """Resolves "category/name" and "category" names to (category, name) pairs of known files."""
+        files = data.files
+        if names is None:
+            return [(category, name) for category in loaders for name in files.get(category, {})]
+
+        pairs = []
+        for target in names:
+            category, _, name = target.partition("/")
+            if category not in loaders:
+                raise ValueError(f"Invalid asset category: {category}")
+            if not name:
+                pairs.extend((category, name) for name in files.get(category, {}))
+            elif name in files.get(category, {}):
+                pairs.append((category, name))
+            else:
+                raise KeyError(f"Asset not found: {target}")
+        return pairs
+
+    @staticmethod
+    def __get_default_font() -> dict[str, Font]:
         """
-        Loads the default system font in a variety of common sizes.
+        Gets the default system font, its sizes are loaded on first use.
 
         Returns:
-            dict[str, dict[int, pygame.font.Font]]:
-                A dictionary mapping the default font name to another dictionary
-                that maps font sizes to `pygame.font.Font` objects.
+            dict[str, Font]: A dictionary mapping the default font name to its lazy `Font`.
         """
         name = pygame.font.get_default_font().split(".")[0]
-        sizes = {
-            size: pygame.font.SysFont(name, size) for size in
-            {1, 2, 4, 8, 10, 12, 14, 16, 18, 24, 32, 48, 64, 72, 96, 128, 144, 192, 256}
-        }
-        return {name: sizes}
+        return {name: Font.sys(name)}
 
-    @staticmethod
-    def __get_all_files(path,ignore=None) -> dict[str, dict[str, str]]:
+    @classmethod
+    def __get_all_files(cls, path: dict[str, str], root: str) -> dict[str, dict[str, str]]:
         """
-        Recursively scan provided directories and build a nested dictionary of file paths.
+        Build a nested dictionary of file paths from the asset manifest and the asset pack of a root directory.
+
+        The manifest is validated instead of walking every directory, see `Manifest`.
+        The files of the asset pack (in builds) are added with their original paths, see `Pack`.
+        The pack is what the build shipped, so a loose file with the same name is ignored (with a warning).
 
         Args:
             path (dict[str, str]): A dictionary where each key is an asset type
                                 (like "images" or "fonts") and the value is the path to its folder.
-            ignore (set[str], optional): A set of folder names to exclude from scanning.
-                                        "__pycache__" is always ignored.
+            root (str): The root directory of the manifest.
 
         Returns:
             dict[str, dict[str, str]]: A nested dictionary structured like:
                 {
                     "images": {
                         "player": "/path/to/images/player.png",
-                        "enemy": "/path/to/images/enemy.png"
+                        "enemies/slime": "/path/to/images/enemies/slime.png"
                     },
                     "fonts": {
                         "main": "/path/to/fonts/arial.ttf"
@@ -221,23 +959,18 @@ class Assets:
                     ...
                 }
         """
-        if not ignore:
-            ignore = set()
-
-        ignore.update({"__pycache__"})
-
+        manifest = cls._manifests[root] = Manifest.load(root)
+        pack = Pack.mount(root)
         data = {}
         for key,value in path.items():
-            for root, dirs, files in os.walk(value,topdown=False):
-                ftype = os.path.basename(root)
-                if ftype in ignore:
-                    continue
-                data[key] = {}
-                for file in files:
-                    full_path = os.path.join(root, file)
-                    name,_ = os.path.splitext(os.path.basename(full_path))
-                    data[key][name] = full_path
-
+            files = manifest.files(value)
+            if pack is not None:
+                packed = pack.files(value)
+                for name in packed.keys() & files.keys():
+                    engine.warning(f"The loose file {files[name]} is ignored, {key}/{name} is in the asset pack.")
+                files.update(packed)
+            data[key] = files
+        manifest.changed and manifest.save()
         return data
 
     @staticmethod
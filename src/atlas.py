@@ -0,0 +1,221 @@
+from .utils import cache
+
+from hashlib import blake2b
+from typing import Any
+
+import pygame
+
+class MaxRectsPacker:
+    """
+    A MaxRects rectangle packer (best short side fit).
+
+    Keeps the list of the maximal free rectangles of a page,
+    every rectangle is placed where it leaves the smallest leftover side.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Initialize an empty page.
+
+        Args:
+            width (int): The page width.
+            height (int): The page height.
+        """
+        self._width = width
+        self._height = height
+        self._free = [pygame.Rect(0, 0, width, height)]
+        self._used = pygame.Rect(0, 0, 0, 0)
+
+    @property
+    def used(self) -> pygame.Rect:
+        """The area that contains every placed rectangle."""
+        return self._used.copy()
+
+    def insert(self, width: int, height: int) -> pygame.Rect | None:
+        """
+        Place a rectangle in the page.
+
+        Args:
+            width (int): The rectangle width.
+            height (int): The rectangle height.
+
+        Returns:
+            pygame.Rect | None: The placed rectangle, or None if it does not fit.
+        """
+        best, best_score = None, None
+        for free in self._free:
+            if free.width < width or free.height < height:
+                continue
+            leftover_x, leftover_y = free.width - width, free.height - height
+            score = (min(leftover_x, leftover_y), max(leftover_x, leftover_y))
+            if best_score is None or score < best_score:
+                best, best_score = free, score
+        if best is None:
+            return None
+
+        placed = pygame.Rect(best.x, best.y, width, height)
+        self.__split(placed)
+        self._used = self._used.union(placed) if self._used.size != (0, 0) else placed.copy()
+        return placed
+
+    def __split(self, placed: pygame.Rect) -> None:
+        """Splits every free rectangle that overlaps the placed one into its maximal leftovers."""
+        kept, pieces = [], []
+        for free in self._free:
+            if not free.colliderect(placed):
+                kept.append(free)
+                continue
+            if placed.left > free.left:
+                pieces.append(pygame.Rect(free.left, free.top, placed.left - free.left, free.height))
+            if placed.right < free.right:
+                pieces.append(pygame.Rect(placed.right, free.top, free.right - placed.right, free.height))
+            if placed.top > free.top:
+                pieces.append(pygame.Rect(free.left, free.top, free.width, placed.top - free.top))
+            if placed.bottom < free.bottom:
+                pieces.append(pygame.Rect(free.left, placed.bottom, free.width, free.bottom - placed.bottom))
+
+        # drop the new pieces that are inside another free rectangle
+        # (the kept ones are maximal already, a piece can never contain them)
+        pieces.sort(key=lambda rect: rect.width * rect.height, reverse=True)
+        for piece in pieces:
+            others = [kept[index] for index in piece.collidelistall(kept)]
+            if not any(other.contains(piece) for other in others):
+                kept.append(piece)
+        self._free = kept
+
+
+class TextureAtlas:
+    """
+    Packs many small surfaces into a few large pages.
+
+    Every packed surface is then a `subsurface` view into its page (no copy),
+    so the images share a few allocations and can be batched from one source surface.
+    The layout depends only on the image sizes, it is cached and reused on the next runs.
+    """
+
+    def __init__(self, pages: list[pygame.Surface], regions: dict[str, tuple[int, pygame.Rect]]) -> None:
+        """
+        Initialize a texture atlas from its pages and regions, see `TextureAtlas.build`.
+
+        Args:
+            pages (list[pygame.Surface]): The page surfaces.
+            regions (dict[str, tuple[int, pygame.Rect]]): The (page index, area) of every image.
+        """
+        self._pages = pages
+        self._regions = regions
+        self._views = {
+            name: pages[page].subsurface(area)
+            for name, (page, area) in regions.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._regions
+
+    @classmethod
+    def build(cls, surfaces: dict[str, pygame.Surface], max_size: int = 2048, padding: int = 1) -> "TextureAtlas":
+        """
+        Packs surfaces into atlas pages.
+
+        Args:
+            surfaces (dict[str, pygame.Surface]): The surfaces to pack by name, each must fit in a page.
+            max_size (int): The maximum width and height of a page. Defaults to 2048.
+            padding (int): The empty pixels around every image, so scaled images do not bleed. Defaults to 1.
+
+        Returns:
+            TextureAtlas: The atlas.
+        """
+        sizes = {name: surface.get_size() for name, surface in surfaces.items()}
+        layout = cls.__get_layout(sizes, max_size, padding)
+
+        pages = [pygame.Surface(size, pygame.SRCALPHA) for size in layout["pages"]]
+        regions = {}
+        for name, (page, x, y) in layout["regions"].items():
+            surface = surfaces[name]
+            # copy the pixels as they are, the pages start transparent
+            pages[page].blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_ADD if surface.get_flags() & pygame.SRCALPHA else 0)
+            regions[name] = (page, pygame.Rect((x, y), surface.get_size()))
+        return cls(pages, regions)
+
+    @property
+    def pages(self) -> list[pygame.Surface]:
+        """The page surfaces."""
+        return list(self._pages)
+
+    @property
+    def memory(self) -> int:
+        """
+        Returns the memory size of the pages in bytes.
+
+        Returns:
+            int: The memory size of the atlas.
+        """
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self._pages)
+
+    def get(self, name: str) -> pygame.Surface | None:
+        """
+        Get the view of a packed image.
+
+        Args:
+            name (str): The image name.
+
+        Returns:
+            pygame.Surface | None: The subsurface of the image in its page, or None if it is not packed.
+        """
+        return self._views.get(name)
+
+    def get_region(self, name: str) -> tuple[int, pygame.Rect] | None:
+        """
+        Get the page and area of a packed image.
+
+        Args:
+            name (str): The image name.
+
+        Returns:
+            tuple[int, pygame.Rect] | None: The (page index, area) of the image, or None if it is not packed.
+        """
+        region = self._regions.get(name)
+        return region and (region[0], region[1].copy())
+
+    @classmethod
+    def __get_layout(cls, sizes: dict[str, tuple[int, int]], max_size: int, padding: int) -> dict[str, Any]:
+        """Returns the cached layout of the sizes, packing them on a miss."""
+        key = repr((sorted(sizes.items()), max_size, padding)).encode()
+        name = f"atlas-{blake2b(key, digest_size=8).hexdigest()}"
+        layout = cache.load_cache(name)
+        if "pages" in layout and layout["regions"].keys() == sizes.keys():
+            return layout
+
+        layout = cls.__pack(sizes, max_size, padding)
+        cache.save_cache(name, layout)
+        return layout
+
+    @staticmethod
+    def __pack(sizes: dict[str, tuple[int, int]], max_size: int, padding: int) -> dict[str, Any]:
+        """Packs the sizes into pages, the largest first."""
+        # start from a square page close to the total area, a smaller page packs tighter
+        area = sum((width + padding * 2) * (height + padding * 2) for width, height in sizes.values())
+        largest = max((max(size) + padding * 2 for size in sizes.values()), default=1)
+        page_size = min(max_size, max(largest, int(area ** 0.5 * 1.15)))
+
+        packers: list[MaxRectsPacker] = []
+        regions = {}
+        for name, (width, height) in sorted(sizes.items(), key=lambda item: (-max(item[1]), item[0])):
+            padded = (width + padding * 2, height + padding * 2)
+            if padded[0] > max_size or padded[1] > max_size:
+                raise ValueError(f"The image {name!r} does not fit in an atlas page of {max_size}x{max_size}.")
+
+            for index, packer in enumerate(packers):
+                placed = packer.insert(*padded)
+                if placed:
+                    break
+            else:
+                packers.append(MaxRectsPacker(page_size, page_size))
+                index, placed = len(packers) - 1, packers[-1].insert(*padded)
+            regions[name] = [index, placed.x + padding, placed.y + padding]
+
+        # shrink the pages to their used area
+        pages = [[packer.used.right, packer.used.bottom] for packer in packers]
+        return {"pages": pages, "regions": regions}
@@ -1,9 +1,11 @@
 from .display import Display
+from .assets import Assets
 from .wrapper.functions import vector
-from .wrapper import Text,Image,Shape
+from .wrapper import Text,Image,Shape,Tilemap,ShapeArray,SpriteArray,Particles
+from .spatial import SpatialHash
 
-from math import log2
-from typing import Tuple
+from math import ceil,log2
+from typing import Tuple,Iterable,List,Any
 
 import pygame
 
@@ -23,6 +25,16 @@ class Camera:
         self._zoom_factor = 0
         self._zoom_direction = 0
         self.__max_zoom_factor = 3
+
+        # cached view transform, updated only when the camera moves or zooms
+        self._view_x = self._view_y = 0
+        self._view_rect = pygame.Rect(0, 0, 0, 0)
+
+        # render queue, flushed by the scene at the end of every frame
+        self._queue = {}  # object -> (layer, key)
+        self._queue_fills = {}  # shape -> fill
+        self._queue_order = []  # the sorted order of the previous frame
+
         self.zoom(1)
 
     @property
@@ -37,11 +49,8 @@ class Camera:
 
     @property
     def rect(self) -> pygame.Rect:
-        """Property to get the camera's rectangle area as a pygame.Rect."""
-        rect = pygame.Rect(self._pos + self._offset, Display._res)
-        rect.width = int(rect.width / self.zoom_scale)
-        rect.height = int(rect.height / self.zoom_scale)
-        return rect
+        """Property to get a copy of the camera's rectangle area as a pygame.Rect."""
+        return self._view_rect.copy()
 
     @property
     def zoom_scale(self) -> float:
@@ -74,10 +83,13 @@ class Camera:
         """
         Set the maximum zoom factor for the camera.
 
+        The power of two zoom levels inside this range are cached for every drawn surface (see `Assets.get_scaled`).
+
         Args:
             factor: The maximum zoom factor to set.
         """
         self.__max_zoom_factor = factor
+        Assets._mipmap_levels = ceil(factor)
 
     def get_max_zoom(self) -> float:
         """
@@ -98,7 +110,24 @@ class Camera:
         Returns:
             True if the object is visible, False otherwise.
         """
-        return self.rect.colliderect(obj.rect)
+        return self._view_rect.colliderect(obj.rect)
+
+    def query(self, index: SpatialHash) -> List[Any]:
+        """
+        Get the objects of a spatial index that are visible on the screen.
+
+        Only the cells under the camera view are visited,
+        so the cost depends on what is visible and not on the size of the world.
+
+        Args:
+            index (SpatialHash): The spatial index to query.
+
+        Returns:
+            List[Any]: The visible objects, in registration order.
+        """
+        rect = self._view_rect
+        visible = rect.colliderect
+        return [obj for obj in index.query(rect) if visible(obj.rect)]
 
     def move(self, offset: Tuple[int | float, int | float] | pygame.math.Vector2) -> None:
         """
@@ -109,6 +138,7 @@ class Camera:
         """
         self._pos.x += offset[0]
         self._pos.y += offset[1]
+        self.__update_view()
 
     def move_at(self, new_pos: Tuple[int | float, int | float] | pygame.math.Vector2) -> None:
         """
@@ -119,6 +149,7 @@ class Camera:
         """
         self._pos.x = new_pos[0] + Display._res[0] / 2
         self._pos.y = new_pos[1] + Display._res[1] / 2
+        self.__update_view()
 
     def zoom(self, factor: int) -> None:
         """
@@ -156,39 +187,162 @@ class Camera:
         self._zoom_scale = scale
         self._zoom_factor = factor
         self._zoom_direction = direction
+        self.__update_view()
+
+    def to_screen(self, pos: Tuple[int | float, int | float] | pygame.math.Vector2) -> Tuple[float, float]:
+        """
+        Convert a world position to a screen position using the cached view transform.
+
+        Args:
+            pos: The world position.
+
+        Returns:
+            Tuple[float, float]: The screen position.
+        """
+        scale = self._zoom_scale
+        return ((pos[0] - self._view_x) * scale, (pos[1] - self._view_y) * scale)
 
     def draw_shape(self, Shape: Shape, fill: int = 0) -> None:
         """Draw a shape on the camera's surface if it is visible."""
-        if not self.is_visible(Shape):
+        if not self._view_rect.colliderect(Shape.rect):
             return
 
-        Shape._pos -= self._pos + self._offset
-        Shape._pos *= self._zoom_scale
-        Shape.draw(self.surface, fill, self._zoom_scale)
-        Shape._pos /= self._zoom_scale
-        Shape._pos += self._offset + self._pos
+        pos = Shape._pos
+        scale = self._zoom_scale
+        rect = Shape.draw(self.surface, fill, scale, ((pos.x - self._view_x) * scale, (pos.y - self._view_y) * scale))
+        Display._dirty_rects and Display._track(rect, (Shape.__class__, Shape._rgba, fill))
 
     def draw_text(self, Txt: Text) -> None:
         """Draw text on the camera's surface if it is visible."""
-        if not self.is_visible(Txt):
+        if not self._view_rect.colliderect(Txt.rect):
             return
 
-        Txt._pos -= self._pos + self._offset
-        Txt._pos *= self._zoom_scale
-        Txt.draw(self.surface, self._zoom_scale)
-        Txt._pos /= self._zoom_scale
-        Txt._pos += self._offset + self._pos
+        pos = Txt._pos
+        scale = self._zoom_scale
+        rect = Txt.draw(self.surface, scale, ((pos.x - self._view_x) * scale, (pos.y - self._view_y) * scale))
+        Display._dirty_rects and Display._track(rect, Txt._surface)
 
     def draw_image(self, Image: Image) -> None:
         """Draw an image on the camera's surface if it is visible."""
-        if not self.is_visible(Image):
+        if not self._view_rect.colliderect(Image.rect):
             return
 
-        Image._pos -= self._pos + self._offset
-        Image._pos *= self._zoom_scale
-        Image.draw(self.surface, self._zoom_scale)
-        Image._pos /= self._zoom_scale
-        Image._pos += self._offset + self._pos
+        pos = Image._pos
+        scale = self._zoom_scale
+        rect = Image.draw(self.surface, scale, ((pos.x - self._view_x) * scale, (pos.y - self._view_y) * scale))
+        Display._dirty_rects and Display._track(rect, Image._surface)
+
+    def draw_tilemap(self, Map: Tilemap) -> None:
+        """Draw the chunks of a tilemap that are visible on the camera's surface."""
+        if not self._view_rect.colliderect(Map.rect):
+            return
+
+        pos = Map._pos
+        scale = self._zoom_scale
+        rect = Map.draw(self.surface, scale, ((pos.x - self._view_x) * scale, (pos.y - self._view_y) * scale))
+        Display._dirty_rects and Display._track(rect, (Map, Map._version))
+
+    def draw_array(self, Array: ShapeArray | SpriteArray | Particles, fill: int = 0) -> None:
+        """Draw a shape array, sprite array or particles on the camera's surface if it is visible."""
+        if not self._view_rect.colliderect(Array.rect):
+            return
+
+        pos = Array._pos
+        scale = self._zoom_scale
+        pos = ((pos.x - self._view_x) * scale, (pos.y - self._view_y) * scale)
+        # shape arrays take a fill like the shapes
+        rect = Array.draw(self.surface, fill, scale, pos) if isinstance(Array, ShapeArray) else Array.draw(self.surface, scale, pos)
+        Display._dirty_rects and Display._track(rect, Array, always=True)
+
+    def draw_batch(self, objs: Iterable[Image | Text]) -> None:
+        """
+        Draw many images and texts on the camera's surface in a single blit call.
+
+        The visibility test and the camera transform are done for the whole batch,
+        then the visible objects are submitted together with `Surface.fblits`.
+
+        Args:
+            objs (Iterable[Image | Text]): The images and texts to draw.
+        """
+        visible = self._view_rect.colliderect
+        view_x, view_y = self._view_x, self._view_y
+        scale = self._zoom_scale
+
+        blits = [
+            (obj._get_surface(scale), ((obj._pos.x - view_x) * scale, (obj._pos.y - view_y) * scale))
+            for obj in objs if visible(obj.rect)
+        ]
+        self.surface.fblits(blits)
+
+        if Display._dirty_rects:
+            for surf, pos in blits:
+                Display._track(surf.get_rect(topleft=pos), surf)
+
+    def __update_view(self) -> None:
+        """Recalculate the cached view transform (offset, scale and view rect)."""
+        self._view_x = self._pos.x + self._offset.x
+        self._view_y = self._pos.y + self._offset.y
+
+        rect = self._view_rect
+        rect.x = self._view_x
+        rect.y = self._view_y
+        rect.width = int(Display._res[0] / self._zoom_scale)
+        rect.height = int(Display._res[1] / self._zoom_scale)
+
+    def submit(self, obj: Shape | Image | Text | Tilemap | ShapeArray | SpriteArray | Particles, layer: int = 0, key: Any = 0, fill: int = 0) -> None:
+        """
+        Queue an object to be drawn at the end of the frame, sorted by layer and then by key.
+
+        Objects with equal layer and key keep the order of the previous frame (or the submit order),
+        so the draw order is stable. Consecutive images and texts are drawn together with `draw_batch`,
+        the other objects with their own draw method (the arrays and particles are already batched).
+
+        Args:
+            obj (Shape | Image | Text | Tilemap | ShapeArray | SpriteArray | Particles): The object to draw.
+            layer (int): The layer of the object, lower layers are drawn first. Defaults to 0.
+            key (Any): The sort key inside the layer, e.g. the y position for y-sorting. Defaults to 0.
+            fill (int): The fill value, used only for shapes and shape arrays. Defaults to 0.
+
+        Note: Submitting the same object twice in a frame only updates its layer and key.
+
+        Example:
+            camera.submit(player, layer=1, key=player.rect.bottom)  # y-sorting
+        """
+        self._queue[obj] = (layer, key)
+        fill and self._queue_fills.__setitem__(obj, fill)
+
+    def _flush(self) -> None:
+        """Draw and clear the render queue (called by the scene at the end of every frame)."""
+        queue = self._queue
+        fills = self._queue_fills
+
+        # start from the previous sorted order, so the sort is close to linear
+        # when most of the keys did not change (list.sort is adaptive and stable)
+        order = [obj for obj in self._queue_order if obj in queue]
+        if len(order) != len(queue):
+            known = set(order)
+            order.extend(obj for obj in queue if obj not in known)
+        order.sort(key=queue.__getitem__)
+
+        run = []
+        for obj in order:
+            if isinstance(obj, (Image, Text)):
+                run.append(obj)
+                continue
+            if run:
+                self.draw_batch(run)
+                run = []
+            if isinstance(obj, Shape):
+                self.draw_shape(obj, fills.get(obj, 0))
+            elif isinstance(obj, Tilemap):
+                self.draw_tilemap(obj)
+            else:  # shape arrays, sprite arrays and particles
+                self.draw_array(obj, fills.get(obj, 0))
+        run and self.draw_batch(run)
+
+        self._queue_order = order
+        self._queue = {}
+        self._queue_fills = {}
 
     def _dynamic_zoom(self) -> None:
         """Dynamically adjust the zoom based on the display's resolution."""
@@ -1,6 +1,7 @@
 from .assets import Assets
+from .wrapper import ShapeArray
 
-from typing import Tuple
+from typing import Tuple,Iterable
 
 import pygame
 
@@ -16,7 +17,8 @@ class Display:
 
     @classmethod
     def init(cls, title: str, resolution:Tuple[int, int], monitor=0, stretch=False,
-             dynamic_zoom=False,fullscreen=False, resizable=False, vsync=False) -> None:
+             dynamic_zoom=False,fullscreen=False, resizable=False, vsync=False, dirty_rects=False,
+             scale_mode="nearest") -> None:
         """
         Initializes the main display window used by all scenes.
 
@@ -28,6 +30,11 @@ class Display:
             fullscreen (bool): Start in fullscreen mode. Defaults to False.
             resizable (bool): Allows the window to be resizable. Defaults to False.
             vsync (bool): Enables vertical sync. Defaults to False.
+            dirty_rects (bool): Clear and update only the screen areas that changed between frames. Defaults to False.
+            scale_mode (str): The scaling used when the window is resized, "nearest" or "smooth". Defaults to "nearest".
+
+        Raises:
+            ValueError: If the scale mode is not supported.
         """
         cls._title = title
         cls._res = tuple(resolution)  # make sure it's tuple, no need to raise an error
@@ -39,6 +46,16 @@ class Display:
 
         cls._stretch = stretch
         cls._dynamic_zoom = dynamic_zoom
+        cls.set_scale_mode(scale_mode)
+        cls._stretch_surf = None  # preallocated, rebuilt only when the resolution changes
+        cls._integer_scale = False
+
+        cls._dirty_rects = dirty_rects
+        cls._dirty = set()  # the (x, y, w, h, key) areas drawn in the current frame
+        cls._last_dirty = set()  # the areas drawn in the previous frame
+        cls._dirty_frame = 0  # tags the always dirty areas, so they never match the previous frame
+        cls._full_redraw = True  # the next clear fills the whole surface
+        cls._full_update = False  # the whole screen is updated at the end of the frame
 
         cls._new_res = None
         cls._last_res = None
@@ -73,6 +90,13 @@ class Display:
             res (Tuple[float, float]): The new resolution.
         """
         cls._new_res = res
+        cls._stretch_surf = None
+
+        if res:
+            # same integer factor on both axes, nearest scaling is exact and fastest
+            factor_x, rest_x = divmod(res[0], cls._res[0])
+            factor_y, rest_y = divmod(res[1], cls._res[1])
+            cls._integer_scale = not rest_x and not rest_y and factor_x == factor_y
 
     @classmethod
     def get_res(cls) -> Tuple[float, float]:
@@ -138,15 +162,55 @@ class Display:
         cls.set_res(new_res)
         cls.__set_mode()
 
+    @classmethod
+    def set_scale_mode(cls, mode: str) -> None:
+        """
+        Set the scaling used when the window is resized.
+
+        Args:
+            mode (str): "nearest" for sharp pixels or "smooth" for filtered scaling.
+
+        Raises:
+            ValueError: If the scale mode is not supported.
+        """
+        if mode not in ("nearest", "smooth"):
+            raise ValueError(f"Invalid scale mode: {mode}")
+        cls._scale_mode = mode
+
+    @classmethod
+    def get_scale_mode(cls) -> str:
+        """
+        Get the scaling used when the window is resized.
+
+        Returns:
+            str: "nearest" or "smooth".
+        """
+        return cls._scale_mode
+
     @classmethod
     def get_stretch_surf(cls) -> pygame.Surface:
         """
         Get a stretched version of the internal surface to the new resolution.
 
+        Note: The surface is preallocated and reused every frame, copy it if you want to keep it.
+
         Returns:
             pygame.Surface: The scaled surface.
         """
-        return pygame.transform.scale(cls.surface, cls._new_res)
+        if cls._stretch_surf is None:
+            cls._stretch_surf = pygame.Surface(cls._new_res, 0, cls.surface)
+        cls.__stretch(cls._stretch_surf)
+        return cls._stretch_surf
+
+    @classmethod
+    def refresh(cls) -> None:
+        """
+        Force a full redraw of the screen on the next frame.
+
+        Only needed in dirty rects mode, if you draw on the surface without the draw methods.
+        It can be called while drawing, the current frame is updated whole and the next one starts with a full clear.
+        """
+        cls._full_redraw = True
 
     @classmethod
     def toggle_fullscreen(cls) -> None:
@@ -175,7 +239,8 @@ class Display:
         """
 
         # Just calls the abstracted shape.draw method, so we only need one method to draw any future shape :)
-        Shape.draw(cls.surface, fill=fill, scale=1)
+        rect = Shape.draw(cls.surface, fill=fill, scale=1)
+        cls._dirty_rects and cls._track(rect, (Shape.__class__, Shape._rgba, fill))
 
     @classmethod
     def draw_text(cls, Txt) -> None:
@@ -185,7 +250,8 @@ class Display:
         Args:
             Txt: A text object with a `.draw()` method.
         """
-        Txt.draw(cls.surface, scale=1)
+        rect = Txt.draw(cls.surface, scale=1)
+        cls._dirty_rects and cls._track(rect, Txt._surface)
 
     @classmethod
     def draw_image(cls, Image) -> None:
@@ -195,7 +261,107 @@ class Display:
         Args:
             Image: An image object with a `.draw()` method.
         """
-        Image.draw(cls.surface, scale=1)
+        rect = Image.draw(cls.surface, scale=1)
+        cls._dirty_rects and cls._track(rect, Image._surface)
+
+    @classmethod
+    def draw_array(cls, Array, fill=0) -> None:
+        """
+        Draw a shape array, sprite array or particles on the screen.
+
+        Args:
+            Array: The array object with a `.draw()` method.
+            fill (int, optional): Fill mode or color, used only for shape arrays. Defaults to 0.
+        """
+        # shape arrays take a fill like the shapes
+        rect = Array.draw(cls.surface, fill, 1) if isinstance(Array, ShapeArray) else Array.draw(cls.surface, 1)
+        cls._dirty_rects and cls._track(rect, Array, always=True)
+
+    @classmethod
+    def draw_batch(cls, objs: Iterable) -> None:
+        """
+        Draw many images and texts on the screen in a single blit call.
+
+        Args:
+            objs (Iterable): Image or text objects to draw.
+        """
+        blits = [(obj._get_surface(1), obj._pos) for obj in objs]
+        cls.surface.fblits(blits)
+        if cls._dirty_rects:
+            for surf, pos in blits:
+                cls._track(surf.get_rect(topleft=pos), surf)
+
+    @classmethod
+    def _draw_stretch(cls) -> None:
+        """Stretch the internal surface to the window, directly into the window surface when possible."""
+        window = cls.window
+        if window.get_size() == tuple(cls._new_res) and window.get_bitsize() == cls.surface.get_bitsize():
+            cls.__stretch(window)
+            return
+        window.blit(cls.get_stretch_surf(), (0, 0))
+
+    @classmethod
+    def __stretch(cls, dest: pygame.Surface) -> None:
+        """Scale the internal surface into a destination surface of the new resolution."""
+        if cls._scale_mode == "smooth" and not cls._integer_scale:
+            pygame.transform.smoothscale(cls.surface, dest.get_size(), dest)
+            return
+        pygame.transform.scale(cls.surface, dest.get_size(), dest)
+
+    @classmethod
+    def _track(cls, rect: pygame.Rect, key, always: bool = False) -> None:
+        """
+        Record an area drawn in the current frame (dirty rects mode).
+
+        Args:
+            rect (pygame.Rect): The drawn area.
+            key: Anything that identifies the drawn content, e.g. the blitted surface.
+            always (bool): The content can change without changing its key (e.g. arrays modified in place),
+                so the area is updated every frame. Defaults to False.
+        """
+        if always:
+            key = (key, cls._dirty_frame)
+        cls._dirty.add((rect.x, rect.y, rect.width, rect.height, key))
+
+    @classmethod
+    def _clear_dirty(cls, color) -> None:
+        """
+        Clear the areas drawn in the previous frame (dirty rects mode).
+
+        Everything outside them is already background, so this clears the whole frame.
+
+        Args:
+            color: The background color.
+        """
+        surface = cls.surface
+        if cls._full_redraw:
+            # cleared only here, a refresh requested while drawing must still reach the next clear
+            surface.fill(color)
+            cls._full_redraw = False
+            cls._full_update = True
+            return
+        for x, y, width, height, _ in cls._last_dirty:
+            surface.fill(color, (x, y, width, height))
+
+    @classmethod
+    def _get_dirty_rects(cls) -> list | None:
+        """
+        End the frame and get the screen areas that changed since the previous one (dirty rects mode).
+
+        Returns:
+            list | None: The changed areas, or None if the whole screen must be updated.
+        """
+        full = cls._full_update or cls._full_redraw
+        changed = None if full else cls._dirty ^ cls._last_dirty
+        cls._dirty_frame += 1
+        cls._last_dirty = cls._dirty
+        cls._dirty = set()
+        cls._full_update = False
+
+        if changed is None:
+            return None
+        bounds = cls.surface.get_rect()
+        return [bounds.clip(x, y, width, height) for x, y, width, height, _ in changed]
 
     # Note: I planned to use the new pygame.Window for more features,
     # but it caused issues with pybgag (web builds), so set_mode for now.
@@ -218,3 +384,4 @@ class Display:
             flags |= pygame.RESIZABLE
 
         cls.window = pygame.display.set_mode(window_res, flags=flags, vsync=vsync,display=display)
+        cls._full_redraw = True
@@ -0,0 +1,35 @@
+# /// script
+# dependencies = [
+#   "pyxora",
+#   "pygame-ce"
+# ]
+# ///
+
+import pyxora
+
+
+async def main():
+    """initializing the engine and starting the benchmark scene."""
+
+    pyxora.debug = True
+
+    # Initialize the display (window size, title, etc.)
+    pyxora.Display.init(
+        title="Benchmark",
+        resolution=(800, 600),
+        fullscreen=False,
+        resizable=False,
+    )
+
+    # Load game assets (e.g., images, sounds, etc.)
+    pyxora.Assets.init(path_scenes="/scenes", pre_load=True)
+
+    # Create and configure the first benchmark scene (scene name,**kwargs)
+    pyxora.Scene.manager.create("batch", max_fps=-1)
+
+    # Start the async scene
+    await pyxora.Scene.manager.start()
+
+
+if __name__ == "__main__":
+    pyxora.asyncio.run(main)
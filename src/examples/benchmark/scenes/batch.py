@@ -0,0 +1,61 @@
+import pyxora
+
+from random import uniform
+from time import perf_counter as time
+
+pygame = pyxora.pygame
+
+class Batch(pyxora.Scene):
+    """Compares drawing sprites one by one against a single batched draw call."""
+
+    counts = (1000, 10000, 50000)
+    modes = ("per-object", "batch")
+    frames = 30
+
+    def _start(self):
+        self.background_color = "gray"
+        self.sprite = pygame.transform.smoothscale(self.assets.get("engine","images","logo"),(16,16))
+        self.results = {}
+        self.cases = [(count,mode) for count in self.counts for mode in self.modes]
+        self.__next_case()
+
+    def _update(self):
+        pass
+
+    def _draw(self):
+        start = time()
+        if self.mode == "batch":
+            self.camera.draw_batch(self.images)
+        else:
+            for image in self.images:
+                self.camera.draw_image(image)
+        self.elapsed += time() - start
+        self.frame += 1
+
+        if self.frame == self.frames:
+            self.results[(self.count,self.mode)] = self.elapsed / self.frames
+            self.__next_case()
+
+    def __next_case(self):
+        if not self.cases:
+            self.__report()
+            self.manager.change("culling")
+            return
+
+        self.count, self.mode = self.cases.pop(0)
+        self.frame = 0
+        self.elapsed = 0
+
+        # spread the sprites over twice the screen area, so culling matters too
+        width, height = self.display.get_res()
+        self.images = [
+            pyxora.Image(self.sprite,(uniform(-width/2,width*1.5),uniform(-height/2,height*1.5)))
+            for _ in range(self.count)
+        ]
+
+    def __report(self):
+        print(f"{'sprites':>8} | {'per-object':>12} | {'batch':>12} | speedup")
+        for count in self.counts:
+            single = self.results[(count,"per-object")]
+            batch = self.results[(count,"batch")]
+            print(f"{count:>8} | {single*1000:>10.2f}ms | {batch*1000:>10.2f}ms | {single/batch:.2f}x")
@@ -0,0 +1,65 @@
+import pyxora
+
+from math import sqrt
+from random import uniform
+from time import perf_counter as time
+
+pygame = pyxora.pygame
+
+class Culling(pyxora.Scene):
+    """Compares culling the whole world against querying a spatial index, at the same sprite density."""
+
+    counts = (1000, 10000, 100000)
+    modes = ("list", "index")
+    frames = 30
+
+    def _start(self):
+        self.background_color = "gray"
+        self.sprite = pygame.transform.smoothscale(self.assets.get("engine","images","logo"),(16,16))
+        self.results = {}
+        self.cases = [(count,mode) for count in self.counts for mode in self.modes]
+        self.__next_case()
+
+    def _update(self):
+        pass
+
+    def _draw(self):
+        start = time()
+        if self.mode == "index":
+            self.camera.draw_batch(self.camera.query(self.index))
+        else:
+            self.camera.draw_batch(self.images)
+        self.elapsed += time() - start
+        self.frame += 1
+
+        if self.frame == self.frames:
+            self.results[(self.count,self.mode)] = self.elapsed / self.frames
+            self.__next_case()
+
+    def __next_case(self):
+        if not self.cases:
+            self.__report()
+            self.manager.change("transform")
+            return
+
+        self.count, self.mode = self.cases.pop(0)
+        self.frame = 0
+        self.elapsed = 0
+
+        # the world grows with the sprite count, so the visible sprites stay the same
+        width, height = self.display.get_res()
+        scale = sqrt(self.count / self.counts[0])
+        self.images = [
+            pyxora.Image(self.sprite,(uniform(0,width*scale),uniform(0,height*scale)))
+            for _ in range(self.count)
+        ]
+        self.index = pyxora.SpatialHash()
+        for image in self.images:
+            self.index.add(image)
+
+    def __report(self):
+        print(f"{'sprites':>8} | {'list':>12} | {'index':>12} | speedup")
+        for count in self.counts:
+            full = self.results[(count,"list")]
+            index = self.results[(count,"index")]
+            print(f"{count:>8} | {full*1000:>10.2f}ms | {index*1000:>10.2f}ms | {full/index:.2f}x")
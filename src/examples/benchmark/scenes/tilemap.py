@@ -0,0 +1,60 @@
+import pyxora
+
+from random import randrange
+from time import perf_counter as time
+
+pygame = pyxora.pygame
+
+class Tilemap(pyxora.Scene):
+    """Measures the draw time of chunked tilemaps of growing size, the view stays the same."""
+
+    sizes = (64, 256, 512)
+    zooms = (1, 0.5)
+    frames = 30
+
+    def _start(self):
+        self.background_color = "gray"
+
+        # a small tileset with 4 colored 16x16 tiles
+        self.tileset = pygame.Surface((64,16))
+        for index,color in enumerate(("red","green","blue","yellow")):
+            self.tileset.fill(color,(index*16,0,16,16))
+
+        self.results = {}
+        self.cases = [(size,zoom) for size in self.sizes for zoom in self.zooms]
+        self.__next_case()
+
+    def _update(self):
+        # keep the camera moving, so different chunks are drawn
+        self.camera.move((1,1))
+
+    def _draw(self):
+        start = time()
+        self.camera.draw_tilemap(self.map)
+        self.elapsed += time() - start
+        self.frame += 1
+
+        if self.frame == self.frames:
+            self.results[(self.size,self.zoom)] = self.elapsed / self.frames
+            self.__next_case()
+
+    def __next_case(self):
+        if not self.cases:
+            self.__report()
+            self.manager.quit()
+
+        self.size, self.zoom = self.cases.pop(0)
+        self.frame = 0
+        self.elapsed = 0
+
+        tiles = [[randrange(4) for _ in range(self.size)] for _ in range(self.size)]
+        self.map = pyxora.Tilemap(self.tileset,(16,16),tiles)
+        self.camera.zoom_at(self.zoom)
+
+        # skip the first frame, it bakes the visible chunks
+        self.camera.draw_tilemap(self.map)
+
+    def __report(self):
+        print(f"{'tiles':>9} | {'zoom':>4} | frame")
+        for (size,zoom),elapsed in self.results.items():
+            print(f"{f'{size}x{size}':>9} | {zoom:>4} | {elapsed*1000:.2f}ms")
@@ -0,0 +1,54 @@
+import pyxora
+
+from random import uniform
+from time import perf_counter as time
+
+pygame = pyxora.pygame
+
+class Transform(pyxora.Scene):
+    """Measures how many camera draw calls per second each object type reaches."""
+
+    kinds = ("image", "text", "shape")
+    zooms = (1, 2)
+    calls = 20000
+
+    def _start(self):
+        self.background_color = "gray"
+        width, height = self.display.get_res()
+        sprite = pygame.transform.smoothscale(self.assets.get("engine","images","logo"),(16,16))
+        position = lambda: (uniform(0,width),uniform(0,height))
+        self.objects = {
+            "image": [pyxora.Image(sprite,position()) for _ in range(self.calls)],
+            "text": [pyxora.Text("text",position(),"white",size=12) for _ in range(self.calls)],
+            "shape": [pyxora.Rect(position(),(8,8),"black") for _ in range(self.calls)],
+        }
+        self.draw = {
+            "image": self.camera.draw_image,
+            "text": self.camera.draw_text,
+            "shape": self.camera.draw_shape,
+        }
+        self.results = {}
+        self.cases = [(kind,zoom) for zoom in self.zooms for kind in self.kinds]
+
+    def _update(self):
+        pass
+
+    def _draw(self):
+        if not self.cases:
+            self.__report()
+            self.manager.change("tilemap")
+            return
+
+        kind, zoom = self.cases.pop(0)
+        self.camera.zoom_at(zoom)
+        draw = self.draw[kind]
+
+        start = time()
+        for obj in self.objects[kind]:
+            draw(obj)
+        self.results[(kind,zoom)] = self.calls / (time() - start)
+
+    def __report(self):
+        print(f"{'object':>8} | {'zoom':>4} | draw calls/s")
+        for (kind,zoom),rate in self.results.items():
+            print(f"{kind:>8} | {zoom:>4} | {rate:>12,.0f}")
@@ -0,0 +1,68 @@
+import pyxora
+
+from time import perf_counter as time
+
+class Fountain(pyxora.Scene):
+    """Measures the update and draw time of a vectorized particle emitter at increasing particle counts."""
+
+    counts = (10000, 25000, 50000)
+    frames = 120
+
+    def _start(self):
+        self.background_color = "black"
+        width, height = self.display.get_res()
+        self.origin = (width / 2, height * 0.8)
+        self.particles = pyxora.Particles(
+            colors=("white", "yellow", "orange", "red", "darkred"),
+            size=(3, 1),
+            lifetime=(1, 2),
+            speed=(100, 250),
+            angle=(230, 310),
+            gravity=(0, 200)
+        )
+        self.results = {}
+        self.cases = list(self.counts)
+        self.__next_case()
+
+    def _update(self):
+        start = time()
+        # keep the live particles around the target count
+        missing = self.count - len(self.particles)
+        missing > 0 and self.particles.emit(min(missing, self.count // 30), self.origin)
+        self.particles.update(self.dt)
+        self.elapsed += time() - start
+
+    def _draw(self):
+        start = time()
+        self.camera.draw_array(self.particles)
+        self.elapsed += time() - start
+        self.frame += 1
+
+        # skip the warm up frames until the emitter reaches the target count
+        if self.frame == self.frames // 2:
+            self.elapsed = 0
+            self.alive = 0
+        if self.frame > self.frames // 2:
+            self.alive += len(self.particles)
+
+        if self.frame == self.frames:
+            samples = self.frames - self.frames // 2
+            self.results[self.count] = (self.alive / samples, self.elapsed / samples)
+            self.__next_case()
+
+    def __next_case(self):
+        if not self.cases:
+            self.__report()
+            self.manager.quit()
+            return
+
+        self.count = self.cases.pop(0)
+        self.frame = 0
+        self.elapsed = 0
+        self.particles.clear()
+
+    def __report(self):
+        print(f"{'target':>8} | {'alive':>8} | {'frame':>10} | max fps")
+        for count in self.counts:
+            alive, elapsed = self.results[count]
+            print(f"{count:>8} | {alive:>8.0f} | {elapsed*1000:>8.2f}ms | {1/elapsed:.0f}")
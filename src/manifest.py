@@ -0,0 +1,238 @@
+from .utils import cache
+
+from hashlib import blake2b
+from typing import Any
+import json
+import os
+
+MANIFEST_FILE = "pyxora.manifest.json"
+"""The name of the manifest file written next to the assets at build time"""
+
+class Manifest:
+    """
+    A persistent index of the asset files under a root directory.
+
+    Every file is recorded with its size, modification time and content hash,
+    and every directory with its modification time. On start the manifest is validated
+    by checking only the directories (a directory changes when a file is added, removed or renamed in it),
+    and only the changed directories are listed again, so the startup time does not depend on the number of files.
+
+    Note: Editing a file in place does not change its directory, use `get` to check a single file.
+    """
+
+    version = 1
+    """The manifest format version, older manifests are rebuilt"""
+    ignore = {"__pycache__"}
+    """The directory names that are never indexed"""
+
+    def __init__(self, root: str) -> None:
+        """
+        Initialize an empty manifest.
+
+        Args:
+            root (str): The root directory, every path in the manifest is relative to it.
+        """
+        self._root = os.path.abspath(root)
+        self._dirs: dict[str, float] = {}
+        self._files: dict[str, list] = {}  # relative path -> [size, mtime, hash]
+        self._changed = False
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    @classmethod
+    def load(cls, root: str) -> "Manifest":
+        """
+        Load the manifest of a root directory and validate it.
+
+        The manifest written at build time is used first, then the one cached in the preferences directory.
+
+        Args:
+            root (str): The root directory.
+
+        Returns:
+            Manifest: The validated manifest (empty if there is none yet).
+        """
+        manifest = cls(root)
+        data = manifest.__read_build() or cache.load_cache(manifest.__cache_name())
+        if data.get("version") == cls.version:
+            manifest._dirs = data.get("dirs", {})
+            manifest._files = data.get("files", {})
+            manifest.validate()
+        return manifest
+
+    @property
+    def root(self) -> str:
+        """The root directory."""
+        return self._root
+
+    @property
+    def changed(self) -> bool:
+        """Whether the manifest changed since it was loaded."""
+        return self._changed
+
+    def validate(self) -> None:
+        """Checks every indexed directory and lists again only the ones that changed."""
+        for directory, mtime in list(self._dirs.items()):
+            if directory not in self._dirs:
+                continue  # removed with its parent
+            try:
+                current = os.stat(self.__abs(directory)).st_mtime
+            except OSError:
+                self.__drop(directory)
+                continue
+            if current != mtime:
+                self.scan(directory, recursive=False)
+
+    def scan(self, directory: str = ".", recursive: bool = True) -> None:
+        """
+        Index a directory, hashing only the new and changed files.
+
+        Args:
+            directory (str): The directory, relative to the root. Defaults to the root.
+            recursive (bool): Scan the subdirectories too. The new subdirectories are always scanned. Defaults to True.
+        """
+        directory = self.__rel(directory)
+        path = self.__abs(directory)
+        prefix = "" if directory == "." else f"{directory}/"
+
+        files, dirs = {}, set()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    entry.name in self.ignore or dirs.add(f"{prefix}{entry.name}")
+                elif entry.is_file() and entry.name != MANIFEST_FILE:
+                    files[f"{prefix}{entry.name}"] = entry.stat()
+
+        # the files of this directory only, the subdirectories have their own entries
+        for name in [name for name in self._files if name.startswith(prefix) and "/" not in name[len(prefix):]]:
+            if name not in files:
+                del self._files[name]
+                self._changed = True
+        for name, stat in files.items():
+            entry = self._files.get(name)
+            if entry is None or entry[0] != stat.st_size or entry[1] != stat.st_mtime:
+                self._files[name] = [stat.st_size, stat.st_mtime, self.__hash(self.__abs(name))]
+                self._changed = True
+
+        for name in [name for name in self._dirs if name.startswith(prefix) and "/" not in name[len(prefix):]]:
+            name in dirs or self.__drop(name)
+        for name in dirs:
+            (recursive or name not in self._dirs) and self.scan(name)
+
+        mtime = os.stat(path).st_mtime
+        if self._dirs.get(directory) != mtime:
+            self._dirs[directory] = mtime
+            self._changed = True
+
+    def files(self, directory: str) -> dict[str, str]:
+        """
+        Get the files of a directory and its subdirectories, indexing it on first use.
+
+        Args:
+            directory (str): The directory, absolute or relative to the root.
+
+        Returns:
+            dict[str, str]: The absolute file paths by name, the files of subdirectories are namespaced (e.g. "enemies/slime").
+        """
+        directory = self.__rel(directory)
+        directory in self._dirs or self.scan(directory)
+
+        prefix = "" if directory == "." else f"{directory}/"
+        start = len(prefix)
+        base = os.path.join(self._root, "")
+        files = {}
+        # plain string operations, this runs for every file on every start
+        for name in self._files:
+            if not name.startswith(prefix):
+                continue
+            dot,slash = name.rfind("."),name.rfind("/")
+            key = name[start:dot] if dot > slash + 1 else name[start:]
+            files[key] = base + (name if os.sep == "/" else name.replace("/", os.sep))
+        return files
+
+    def get(self, path: str) -> dict[str, Any] | None:
+        """
+        Get the record of a file, updating it if the file changed.
+
+        Args:
+            path (str): The file path, absolute or relative to the root.
+
+        Returns:
+            dict[str, Any] | None: The size, mtime and hash of the file, or None if it is not indexed.
+        """
+        name = self.__rel(path)
+        entry = self._files.get(name)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(self.__abs(name))
+        except OSError:
+            return None
+        if entry[0] != stat.st_size or entry[1] != stat.st_mtime:
+            entry = self._files[name] = [stat.st_size, stat.st_mtime, self.__hash(self.__abs(name))]
+            self._changed = True
+        return {"size": entry[0], "mtime": entry[1], "hash": entry[2]}
+
+    def save(self, build: bool = False) -> bool:
+        """
+        Save the manifest, in the preferences directory or next to the assets.
+
+        Args:
+            build (bool): Write the manifest file in the root directory (at build time). Defaults to False.
+
+        Returns:
+            bool: True if the manifest was saved.
+        """
+        data = {"version": self.version, "dirs": self._dirs, "files": self._files}
+        if not build:
+            saved = cache.save_cache(self.__cache_name(), data)
+        else:
+            try:
+                with open(os.path.join(self._root, MANIFEST_FILE), "w", encoding="utf-8") as file:
+                    json.dump(data, file)
+                saved = True
+            except OSError:
+                saved = False
+        self._changed = self._changed and not saved
+        return saved
+
+    def __drop(self, directory: str) -> None:
+        """Removes a directory and everything under it from the manifest."""
+        prefix = f"{directory}/"
+        self._dirs = {name: mtime for name, mtime in self._dirs.items() if name != directory and not name.startswith(prefix)}
+        self._files = {name: entry for name, entry in self._files.items() if not name.startswith(prefix)}
+        self._changed = True
+
+    def __read_build(self) -> dict[str, Any]:
+        """Reads the manifest written at build time, if there is one."""
+        path = os.path.join(self._root, MANIFEST_FILE)
+        if not os.path.isfile(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def __cache_name(self) -> str:
+        """Returns the cache name of the root directory."""
+        return f"manifest-{blake2b(self._root.encode(), digest_size=8).hexdigest()}"
+
+    def __rel(self, path: str) -> str:
+        """Returns a path relative to the root, with / separators."""
+        path = os.path.relpath(os.path.join(self._root, path), self._root)
+        return path.replace(os.sep, "/")
+
+    def __abs(self, path: str) -> str:
+        """Returns the absolute path of a relative path."""
+        return os.path.normpath(os.path.join(self._root, path))
+
+    @staticmethod
+    def __hash(path: str) -> str:
+        """Returns the content hash of a file."""
+        digest = blake2b(digest_size=16)
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -0,0 +1,306 @@
+from hashlib import blake2b
+from typing import Any, Iterable
+import io
+import json
+import os
+import struct
+
+try:
+    import mmap
+except ImportError:  # not available on some platforms (e.g. the web)
+    mmap = None
+
+PACK_FILE = "assets.pxpak"
+"""The name of the asset pack written at build time"""
+
+_HEADER = struct.Struct("<6sHQQ")  # magic, version, index offset, index size
+_MAGIC = b"PXPAK\x00"
+_ALIGN = 64  # every file starts on a cache line
+
+class PackFile(io.RawIOBase):
+    """
+    A read-only file object over a file of an asset pack.
+
+    Reads are slices of the memory-mapped pack, so nothing is copied until the decoder asks for the bytes.
+    It can be passed to anything that accepts a file object, like `pygame.image.load` or `pygame.mixer.Sound`.
+    """
+
+    def __init__(self, view: memoryview, name: str) -> None:
+        """
+        Initialize a file object over a memory view.
+
+        Args:
+            view (memoryview): The bytes of the file.
+            name (str): The file path, used as the name hint of the decoders.
+        """
+        super().__init__()
+        self._view = view
+        self._pos = 0
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<PackFile | name: {self.name}, size: {len(self._view)}>"
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._view[self._pos:self._pos + len(buffer)]
+        size = len(data)
+        memoryview(buffer).cast("B")[:size] = data
+        self._pos += size
+        return size
+
+    def readall(self) -> bytes:
+        data = self._view[self._pos:].tobytes()
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._pos
+
+    def getbuffer(self) -> memoryview:
+        """
+        Get the whole file without copying it.
+
+        Returns:
+            memoryview: The bytes of the file.
+        """
+        return self._view
+
+
+class Pack:
+    """
+    A single-file asset pack, written by `pyxora build`.
+
+    The pack is an index followed by the files, aligned to 64 bytes, and is opened once with `mmap`.
+    The files are then read as zero-copy slices of the mapping instead of being opened one by one,
+    so a build ships a couple of files instead of the whole asset tree and starts faster on slow disks.
+
+    Layout:
+        header (magic, version, index offset, index size), the files, the JSON index
+        {"relative/path.png": [offset, size, hash], ...}
+    """
+
+    version = 1
+    """The pack format version"""
+    _mounted: dict[str, "Pack"] = {}
+    """@private The mounted packs by root directory"""
+
+    def __init__(self, root: str, buffer: Any, files: dict[str, list]) -> None:
+        """
+        Initialize a pack from its mapped bytes, see `Pack.mount`.
+
+        Args:
+            root (str): The directory the paths of the pack are relative to.
+            buffer (Any): The bytes of the pack (an mmap or bytes).
+            files (dict[str, list]): The [offset, size, hash] of every file by relative path.
+        """
+        self._root = os.path.abspath(root)
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._files = files
+
+    def __repr__(self) -> str:
+        return f"<Pack | root: {self._root}, files: {len(self._files)}>"
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._files
+
+    @classmethod
+    def write(cls, path: str, root: str, names: Iterable[str]) -> int:
+        """
+        Write an asset pack.
+
+        Args:
+            path (str): The pack file path.
+            root (str): The directory of the files.
+            names (Iterable[str]): The file paths to pack, relative to the root.
+
+        Returns:
+            int: The size of the pack in bytes.
+        """
+        files = {}
+        with open(path, "wb") as pack:
+            pack.write(b"\x00" * _HEADER.size)
+            for name in names:
+                name = name.replace(os.sep, "/")
+                pack.write(b"\x00" * (-pack.tell() % _ALIGN))
+                offset = pack.tell()
+                digest = blake2b(digest_size=16)
+                with open(os.path.join(root, name), "rb") as file:
+                    for chunk in iter(lambda: file.read(1 << 20), b""):
+                        digest.update(chunk)
+                        pack.write(chunk)
+                files[name] = [offset, pack.tell() - offset, digest.hexdigest()]
+
+            index = json.dumps({"version": cls.version, "files": files}).encode()
+            index_offset = pack.tell()
+            pack.write(index)
+            size = pack.tell()
+            pack.seek(0)
+            pack.write(_HEADER.pack(_MAGIC, cls.version, index_offset, len(index)))
+        return size
+
+    @classmethod
+    def mount(cls, root: str) -> "Pack | None":
+        """
+        Open the asset pack of a root directory, once.
+
+        Args:
+            root (str): The directory with the pack file.
+
+        Returns:
+            Pack | None: The pack, or None if there is no valid pack.
+        """
+        root = os.path.abspath(root)
+        if root in cls._mounted:
+            return cls._mounted[root]
+
+        path = os.path.join(root, PACK_FILE)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, "rb") as file:
+                try:
+                    buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (AttributeError, OSError, ValueError):
+                    buffer = file.read()  # no mmap, read it at once
+            magic, version, offset, size = _HEADER.unpack_from(buffer, 0)
+            if magic != _MAGIC or version != cls.version:
+                return None
+            index = json.loads(bytes(buffer[offset:offset + size]))
+        except (OSError, ValueError, struct.error):
+            return None
+
+        pack = cls._mounted[root] = cls(root, buffer, index["files"])
+        return pack
+
+    @classmethod
+    def get_file(cls, path: str, buffered: bool = False) -> "PackFile | io.BytesIO | str":
+        """
+        Open a file from the mounted packs.
+
+        Args:
+            path (str): The absolute file path.
+            buffered (bool): Copy the file into a `io.BytesIO`, see `Pack.open`. Defaults to False.
+
+        Returns:
+            PackFile | io.BytesIO | str: The file object of the packed file, or the path itself if it is not packed.
+        """
+        pack, name = cls.__locate(path)
+        file = pack and pack.open(name, buffered)
+        return path if file is None else file
+
+    @classmethod
+    def get_record(cls, path: str) -> dict[str, Any] | None:
+        """
+        Get the record of a file from the mounted packs.
+
+        Args:
+            path (str): The absolute file path.
+
+        Returns:
+            dict[str, Any] | None: The size and hash of the file, or None if it is not packed.
+        """
+        pack, name = cls.__locate(path)
+        return pack and pack.get(name)
+
+    @classmethod
+    def __locate(cls, path: str) -> tuple["Pack | None", str]:
+        """Returns the mounted pack of an absolute path and the path relative to it."""
+        for root, pack in cls._mounted.items():
+            # plain string operations, this runs for every loaded asset
+            if path.startswith(root) and path[len(root):len(root) + 1] == os.sep:
+                return pack, path[len(root) + 1:]
+        return None, path
+
+    @property
+    def root(self) -> str:
+        """The directory the paths of the pack are relative to."""
+        return self._root
+
+    def view(self, name: str) -> memoryview | None:
+        """
+        Get the bytes of a packed file without copying them.
+
+        Args:
+            name (str): The file path, relative to the root.
+
+        Returns:
+            memoryview | None: The bytes of the file, or None if it is not packed.
+        """
+        entry = self._files.get(name.replace(os.sep, "/"))
+        return entry and self._view[entry[0]:entry[0] + entry[1]]
+
+    def open(self, name: str, buffered: bool = False) -> PackFile | io.BytesIO | None:
+        """
+        Open a packed file.
+
+        Args:
+            name (str): The file path, relative to the root.
+            buffered (bool): Copy the file into a `io.BytesIO` instead of reading the mapping.
+                The decoders read a file in many small chunks, for small files one copy is
+                faster than that many python reads. Large streamed files (music, fonts) should not be copied. Defaults to False.
+
+        Returns:
+            PackFile | io.BytesIO | None: The file object, or None if it is not packed.
+        """
+        view = self.view(name)
+        if view is None:
+            return None
+        if buffered:
+            return io.BytesIO(view)
+        return PackFile(view, os.path.join(self._root, name))
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """
+        Get the record of a packed file.
+
+        Args:
+            name (str): The file path, relative to the root.
+
+        Returns:
+            dict[str, Any] | None: The size and hash of the file, or None if it is not packed.
+        """
+        entry = self._files.get(name.replace(os.sep, "/"))
+        return entry and {"size": entry[1], "hash": entry[2]}
+
+    def files(self, directory: str) -> dict[str, str]:
+        """
+        Get the packed files of a directory and its subdirectories, like `Manifest.files`.
+
+        Args:
+            directory (str): The directory, absolute or relative to the root.
+
+        Returns:
+            dict[str, str]: The absolute file paths by name, the files of subdirectories are namespaced (e.g. "enemies/slime").
+        """
+        directory = os.path.relpath(os.path.join(self._root, directory), self._root).replace(os.sep, "/")
+        prefix = "" if directory == "." else f"{directory}/"
+        start = len(prefix)
+        base = os.path.join(self._root, "")
+        files = {}
+        for name in self._files:
+            if not name.startswith(prefix):
+                continue
+            dot,slash = name.rfind("."),name.rfind("/")
+            key = name[start:dot] if dot > slash + 1 else name[start:]
+            files[key] = base + (name if os.sep == "/" else name.replace("/", os.sep))
+        return files
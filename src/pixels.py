@@ -0,0 +1,274 @@
+from .utils import cache
+
+from contextlib import suppress
+from typing import BinaryIO,Callable,Iterable
+import atexit
+import os
+import sys
+
+import pygame
+
+try:
+    import mmap
+except ImportError:  # not available on some platforms (e.g. the web)
+    mmap = None
+
+_ALIGN = 64  # every image starts on a cache line
+
+class PixelCache:
+    """
+    A persistent cache of decoded images, in the pixel format of the display.
+
+    The first run decodes every image as usual and saves its converted pixels with `tobytes`,
+    keyed by the content hash of the file. The next runs map the cache file (read only)
+    and build every surface from its own copy of the mapped pixels, skipping the PNG/JPEG
+    decoding and the `convert_alpha`. A changed file has a new hash, so it is decoded again.
+
+    The cache is a raw pixel file and a JSON index in the preferences directory,
+    it is reset when the display pixel format changes. New images are appended to the file,
+    the images of changed or deleted files are dropped by rewriting it on `PixelCache.save`.
+    """
+
+    version = 1
+    """The cache format version, older caches are reset"""
+
+    def __init__(self, name: str, hasher: Callable[[str], str | None], keys: Callable[[], Iterable[str]] | None = None) -> None:
+        """
+        Initialize a pixel cache and map its saved pixels.
+
+        Args:
+            name (str): The cache name.
+            hasher (Callable[[str], str | None]): Returns the content hash of an image path, or None if it is unknown.
+            keys (Callable[[], Iterable[str]], optional): Returns the hashes of the current image files,
+                the saved images of any other hash are dropped on save. Defaults to keeping every saved image.
+        """
+        self._name = name
+        self._hasher = hasher
+        self._keys = keys
+        self._path = cache.get_cache_path(name, "bin")
+        self._format, self._key = self.__get_format()
+        self._images: dict[str, list] = {}  # hash -> [offset, width, height]
+        self._pending: dict[str, tuple[bytes, int, int]] = {}
+        self._size = 0
+        self._view: memoryview | None = None
+        self._mapped = False  # a mapped file is never truncated, its pages may still be read
+        self.__open()
+        atexit.register(self.save)
+
+    def __repr__(self) -> str:
+        return f"<PixelCache | images: {len(self._images)}, pending: {len(self._pending)}, size: {self._size}>"
+
+    def __len__(self) -> int:
+        return len(self._images) + len(self._pending)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache can be used (a writable cache directory and a known pixel format)."""
+        return self._path is not None and self._format is not None
+
+    @property
+    def size(self) -> int:
+        """The size of the saved pixels in bytes."""
+        return self._size
+
+    def load(self, path: str, decoder: Callable[[str], pygame.Surface]) -> pygame.Surface:
+        """
+        Load an image from the cache, decoding and caching it on a miss.
+
+        Args:
+            path (str): The image path.
+            decoder (Callable[[str], pygame.Surface]): Decodes the image file on a miss.
+
+        Returns:
+            pygame.Surface: The image, in the display pixel format.
+        """
+        return self.finish(self.decode(path, decoder))
+
+    def decode(self, path: str, decoder: Callable[[str], pygame.Surface]) -> tuple[str | None, pygame.Surface, bool]:
+        """
+        The part of `PixelCache.load` that can run in a background thread.
+
+        Args:
+            path (str): The image path.
+            decoder (Callable[[str], pygame.Surface]): Decodes the image file on a miss.
+
+        Returns:
+            tuple[str | None, pygame.Surface, bool]: The hash, the surface and whether it came from the cache.
+        """
+        key = self.enabled and self._hasher(path) or None
+        surface = key and self.get(key)
+        if surface is not None:
+            return key, surface, True
+        return key, decoder(path), False
+
+    def finish(self, decoded: tuple[str | None, pygame.Surface, bool]) -> pygame.Surface:
+        """
+        The part of `PixelCache.load` that must run on the main thread, converts and caches a decoded image.
+
+        Args:
+            decoded (tuple[str | None, pygame.Surface, bool]): The result of `PixelCache.decode`.
+
+        Returns:
+            pygame.Surface: The image, in the display pixel format.
+        """
+        key, surface, hit = decoded
+        if hit:
+            return surface
+        surface = surface.convert_alpha()
+        key and self.add(key, surface)
+        return surface
+
+    def get(self, key: str) -> pygame.Surface | None:
+        """
+        Get a cached image.
+
+        Args:
+            key (str): The content hash of the image file.
+
+        Returns:
+            pygame.Surface | None: A new surface with a copy of the cached pixels, or None on a miss.
+        """
+        # every surface owns its pixels, the game may draw on it (and images with the same hash are not shared)
+        entry = self._images.get(key)
+        if entry is not None:
+            offset, width, height = entry
+            return pygame.image.frombuffer(bytearray(self._view[offset:offset + width * height * 4]), (width, height), self._format)
+        pending = self._pending.get(key)
+        if pending is not None:
+            pixels, width, height = pending
+            return pygame.image.frombuffer(bytearray(pixels), (width, height), self._format)
+        return None
+
+    def add(self, key: str, surface: pygame.Surface) -> None:
+        """
+        Add a converted image, it is written on the next `PixelCache.save`.
+
+        Args:
+            key (str): The content hash of the image file.
+            surface (pygame.Surface): The image, in the display pixel format.
+        """
+        if self.enabled and key not in self._images:
+            # copied now, the game may draw on the surface later
+            self._pending[key] = (pygame.image.tobytes(surface, self._format), *surface.get_size())
+
+    def save(self) -> bool:
+        """
+        Write the pending images to the cache, dropping the saved images no current file references.
+
+        Returns:
+            bool: True if there was nothing to write or the images were saved.
+        """
+        live = None
+        if self._keys is not None and self._images:
+            live = set(self._keys())
+            live = None if all(key in live for key in self._images) else live
+        if not self._pending and live is None:
+            return True
+        if not self.enabled:
+            return False
+
+        try:
+            images, size = self.__append() if live is None else self.__compact(live)
+        except OSError:
+            self.__open()  # the compaction may have closed the mapping
+            return False
+
+        data = {"version": self.version, "format": self._key, "size": size, "images": images}
+        if not cache.save_cache(self._name, data):
+            return False
+        self._images, self._size = images, size
+        self._pending.clear()
+        self.__open()
+        return True
+
+    def clear(self) -> None:
+        """Remove every cached image, the surfaces already built stay valid."""
+        self._images, self._pending, self._size, self._view = {}, {}, 0, None
+        cache.save_cache(self._name, {})
+
+    def __append(self) -> tuple[dict[str, list], int]:
+        """Appends the pending images to the cache file, the saved part may be mapped so it is never rewritten."""
+        images = dict(self._images)
+        with open(self._path, "ab" if self._size or self._mapped else "wb") as file:
+            for key, (pixels, width, height) in self._pending.items():
+                self.__write(file, images, key, pixels, width, height)
+            return images, file.tell()
+
+    def __compact(self, live: set[str]) -> tuple[dict[str, list], int]:
+        """Writes the live saved images and the pending ones to a new cache file and replaces the old one."""
+        images = {}
+        temp = f"{self._path}.tmp"
+        try:
+            with open(temp, "wb") as file:
+                for key, (offset, width, height) in self._images.items():
+                    key in live and self.__write(file, images, key, self._view[offset:offset + width * height * 4], width, height)
+                for key, (pixels, width, height) in self._pending.items():
+                    self.__write(file, images, key, pixels, width, height)
+                size = file.tell()
+            # the surfaces own their pixels, so the old mapping can go (a mapped file can not be replaced on Windows)
+            self.__close()
+            os.replace(temp, self._path)
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp)
+            raise
+        return images, size
+
+    @staticmethod
+    def __write(file: BinaryIO, images: dict[str, list], key: str, pixels: bytes | memoryview, width: int, height: int) -> None:
+        """Writes the pixels of an image at the next aligned offset and records it."""
+        file.write(b"\x00" * (-file.tell() % _ALIGN))
+        images[key] = [file.tell(), width, height]
+        file.write(pixels)
+
+    def __close(self) -> None:
+        """Unmaps the saved pixels."""
+        view, self._view = self._view, None
+        if view is None:
+            return
+        buffer = view.obj
+        with suppress(BufferError):  # still exported, it is closed when the last view is gone
+            view.release()
+            mmap is not None and isinstance(buffer, mmap.mmap) and buffer.close()
+
+    def __open(self) -> None:
+        """Reads the index and maps the saved pixels."""
+        if not self.enabled:
+            return
+        data = cache.load_cache(self._name)
+        size = data.get("size", 0)
+        try:
+            valid = data.get("version") == self.version and data.get("format") == self._key and os.path.getsize(self._path) >= size
+        except OSError:
+            valid = False
+        if not valid or not size:
+            self._images, self._size, self._view = {}, 0, None
+            return
+
+        try:
+            with open(self._path, "rb") as file:
+                try:
+                    buffer = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+                except (AttributeError, OSError, ValueError):
+                    buffer = file.read(size)  # no mmap, read it at once
+        except OSError:
+            self._images, self._size, self._view = {}, 0, None
+            return
+        self._images, self._size, self._view = data["images"], size, memoryview(buffer)
+        self._mapped = True
+
+    @staticmethod
+    def __get_format() -> tuple[str | None, str]:
+        """Returns the `tobytes` format of the display pixel format and its cache key."""
+        try:
+            surface = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        except pygame.error:  # no display mode yet
+            return None, ""
+        if surface.get_bytesize() != 4:
+            return None, ""
+
+        # the byte order of the channels in memory
+        shifts = dict(zip("RGBA", surface.get_shifts()))
+        order = "".join(sorted(shifts, key=shifts.get, reverse=sys.byteorder == "big"))
+        key = f"{order}-{surface.get_masks()}"
+        return (order if order in ("RGBA", "BGRA", "ARGB", "ABGR") else None), key
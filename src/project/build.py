@@ -7,6 +7,8 @@ import tempfile
 from importlib.metadata import requires
 from time import perf_counter as time
 from .info import info
+from ..manifest import Manifest
+from ..pack import Pack, PACK_FILE
 from .path import get_path, valid_project
 
 
@@ -112,6 +114,20 @@ def local_build(args):
             return
 
     print("Copying project files into the build directory...")
+    manifest = Manifest(build_dir)
+    pack = not args.no_pack
+    packed = []  # the asset files go into the pack, only the python files are copied
+
+    def ignore(directory, names):
+        ignored = {"__pycache__"}
+        if pack:
+            for file in names:
+                path = os.path.join(directory, file)
+                if os.path.isfile(path) and not file.endswith(".py"):
+                    packed.append(os.path.relpath(path, project_path))
+                    ignored.add(file)
+        return ignored
+
     for item in os.listdir(project_path):
         src = os.path.join(project_path, item)
         dst = os.path.join(build_dir, item)
@@ -125,13 +141,27 @@ def local_build(args):
 
         try:
             if os.path.isdir(src):
-                shutil.copytree(src, dst, dirs_exist_ok=True)
+                shutil.copytree(src, dst, ignore=ignore, dirs_exist_ok=True)
+                manifest.scan(item)  # index the asset folders, so the game skips the directory walk
             else:
                 shutil.copy2(src, dst)
         except Exception as e:
             print(f"Error copying {src} to {dst}: {e}")
             return
 
+    if packed:
+        print(f"Packing {len(packed)} asset files...")
+        try:
+            size = Pack.write(os.path.join(build_dir, PACK_FILE), project_path, packed)
+            print(f"Asset pack size: {size / 1024 / 1024:.2f} MB")
+        except OSError as e:
+            print(f"Error writing the asset pack: {e}")
+            return
+
+    print("Writing the asset manifest...")
+    if not manifest.save(build=True):
+        print("Error writing the asset manifest")
+
     print(f"Build completed successfully. Executable and files are in: {build_dir}")
 
     x2 = time()
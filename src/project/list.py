@@ -4,7 +4,8 @@ import os
 def ls(args):
     """List all projects"""
     path = get_projects_path()
-    projects = [f for f in os.listdir(path) if os.path.isdir(os.path.join(path, f))]
+    # skip the hidden directories, like the engine cache
+    projects = [f for f in os.listdir(path) if not f.startswith(".") and os.path.isdir(os.path.join(path, f))]
 
     if not projects:
         print("No projects found")
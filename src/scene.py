@@ -69,6 +69,7 @@ class SceneManager:
         scene_obj._Scene__running = False
 
         cls.create(name,**kwargs)
+        Assets.release(scene_obj)  # after the new scene acquired its assets, so the shared ones stay loaded
 
     @classmethod
     def pause(cls) -> None:
@@ -87,6 +88,7 @@ class SceneManager:
         scene_obj._on_resume()
         scene_obj._Scene__paused = False
         scene_obj._Scene__dt = 0
+        Display.refresh()  # the paused frames are drawn without clearing
 
     @classmethod
     def restart(cls) -> None:
@@ -109,6 +111,7 @@ class SceneManager:
         # manual create a new scene
         name, obj, kwargs = cls.scene
         cls.create(name,**kwargs)
+        Assets.release(obj)
 
     @classmethod
     def quit(cls) -> None:
@@ -328,6 +331,12 @@ class Scene:
     _global_runtime = _global_pausetime = 0
     __global_start_time = time()
 
+    uses: Tuple[str, ...] = ()
+    """
+    The assets the scene uses, as "category/name" or a whole "category" (e.g. ("images/player", "sfx")).\n
+    They are acquired when the scene is created and released when it is left, see `Assets.acquire`.
+    """
+
     def __init__(self,**kwargs: Any) -> None:
         """
         Initializes a Scene object.
@@ -423,6 +432,7 @@ class Scene:
     def background_color(self, value: str | Tuple[int, int, int]):
         """Setter to set the background color"""
         self._background_color = value
+        Display.refresh()
 
     @property
     def runtime(self) -> float:
@@ -647,6 +657,8 @@ class Scene:
 
             while self.__running:
                 self.__handle_events()
+                Assets._loading and Assets._update_loading()
+                Assets._watcher is not None and self.__hot_reload()
                 self.__update()
                 self.__render()
                 self.__flip()
@@ -678,6 +690,7 @@ class Scene:
             # set manual the scene kwargs to the scene
             for k, v in kwargs.items():
                 setattr(self, k, v)
+            Assets.acquire(self, self.uses)
             self._on_create()
         except Exception as e:
             # expect on_create error as is not in the main loop
@@ -696,6 +709,17 @@ class Scene:
 
         self._start_time = time()
         self.__running = True
+        Display.refresh()
+
+    def __hot_reload(self):
+        """Picks up the game files that changed on disk, see `Assets._update_watcher`."""
+        reloaded = Assets._update_watcher()
+        if not reloaded:
+            return
+        Display.refresh()  # the surfaces changed in place, the dirty rects can not see it
+        for old, new in reloaded:
+            if old is type(self):
+                self.__class__ = new  # the scene keeps its state, with the new code
 
     def __handle_error(self,e):
         """ Handles every possible error with a nice message."""
@@ -781,19 +805,33 @@ class Scene:
         if not self.__paused:  # skip background if paused to keep the last frame render
             self.__draw_background()
         (self._paused_draw if self.__paused else self._draw)()
+        self._camera._flush()  # draw the submitted objects in layer order
 
     def __draw_background(self):
         """Clears the screen with the background color."""
+        if Display._dirty_rects:
+            Display._clear_dirty(self._background_color)
+            return
         Display.surface.fill(self._background_color)
 
     def __draw_display(self):
         """Draws the display."""
-        surf = Display.get_stretch_surf() if Display.is_resized() else Display.surface
-        Display.window.blit(surf,(0,0))
+        rects = Display._get_dirty_rects() if Display._dirty_rects else None
+        if rects is not None and not Display.is_resized():
+            # update only the areas that changed
+            for rect in rects:
+                Display.window.blit(Display.surface,rect,rect)
+            pygame.display.update(rects)
+            return
+
+        if Display.is_resized():
+            Display._draw_stretch()
+        else:
+            Display.window.blit(Display.surface,(0,0))
+        pygame.display.flip()
 
     def __flip(self):
         """Updates the display with the latest frame."""
         self.__update_fps()  # I think updating the fps before the flip is the best place?
         self._dt = round(Display.clock.tick(self._max_fps) / 1000, 3)  # Also take the dt
         self.__draw_display()
-        pygame.display.flip()
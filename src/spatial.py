@@ -0,0 +1,152 @@
+from math import floor
+from itertools import count
+from typing import Any,Dict,List,Set,Tuple
+
+import pygame
+
+class SpatialHash:
+    """
+    A uniform grid index for fast area queries.
+
+    Objects with a `rect` attribute (Shapes, Images, Texts) can be registered.
+    Registered objects update their cells themselves on `move`/`move_at`,
+    so a query only visits the cells under the given area instead of every object.
+
+    Note: Register static or large worlds, the camera can then query only what is on screen.
+    """
+
+    def __init__(self, cell_size: int = 128) -> None:
+        """
+        Initialize an empty spatial hash.
+
+        Args:
+            cell_size (int): The width and height of a grid cell. Defaults to 128.
+        """
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[Any]] = {}
+        self._objects: Dict[Any, Tuple[int, int, int, int]] = {}
+        self._order: Dict[Any, int] = {}  # keep the registration order as the draw order
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, obj: Any) -> bool:
+        return obj in self._objects
+
+    def __iter__(self):
+        return iter(self._objects)
+
+    @property
+    def cell_size(self) -> int:
+        """Property to get the size of a grid cell."""
+        return self._cell_size
+
+    def add(self, obj: Any) -> None:
+        """
+        Register an object to the index.
+
+        An object is in one index at a time (the one its moves update), so it is removed from its previous index first.
+
+        Args:
+            obj: The object to register (requires a rect attribute).
+        """
+        if obj in self._objects:
+            return
+        previous = getattr(obj, "_index", None)
+        previous is not None and previous.remove(obj)
+        bounds = self.__bounds(obj.rect)
+        self._objects[obj] = bounds
+        self._order[obj] = next(self._counter)
+        self.__insert(obj, bounds)
+        obj._index = self
+
+    def remove(self, obj: Any) -> None:
+        """
+        Unregister an object from the index.
+
+        Args:
+            obj: The object to unregister.
+        """
+        bounds = self._objects.pop(obj, None)
+        if bounds is None:
+            return
+        del self._order[obj]
+        self.__discard(obj, bounds)
+        obj._index = None
+
+    def update(self, obj: Any) -> None:
+        """
+        Update the cells of a registered object after it moved.
+
+        Args:
+            obj: The object that moved.
+        """
+        old = self._objects.get(obj)
+        if old is None:
+            return
+        new = self.__bounds(obj.rect)
+        if new == old:
+            return  # still in the same cells, nothing to do
+        self.__discard(obj, old)
+        self.__insert(obj, new)
+        self._objects[obj] = new
+
+    def query(self, area: pygame.Rect | pygame.FRect) -> List[Any]:
+        """
+        Get all the objects whose cells overlap an area, in registration order.
+
+        Note: The result may contain objects near the area, use `colliderect` for an exact test.
+
+        Args:
+            area (pygame.Rect | pygame.FRect): The area to query.
+
+        Returns:
+            List[Any]: The objects found in the cells under the area.
+        """
+        x0, y0, x1, y1 = self.__bounds(area)
+        cells = self._cells
+        found = set()
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = cells.get((x, y))
+                cell and found.update(cell)
+        return sorted(found, key=self._order.__getitem__)
+
+    def clear(self) -> None:
+        """Unregister all the objects."""
+        for obj in self._objects:
+            obj._index = None
+        self._objects.clear()
+        self._order.clear()
+        self._cells.clear()
+
+    def __bounds(self, rect: pygame.Rect | pygame.FRect) -> Tuple[int, int, int, int]:
+        """Returns the (first column, first row, last column, last row) cells of a rect."""
+        size = self._cell_size
+        return (
+            floor(rect.left / size), floor(rect.top / size),
+            floor(rect.right / size), floor(rect.bottom / size)
+        )
+
+    def __insert(self, obj: Any, bounds: Tuple[int, int, int, int]) -> None:
+        """Adds an object to every cell inside the bounds."""
+        x0, y0, x1, y1 = bounds
+        cells = self._cells
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = cells.get((x, y))
+                if cell is None:
+                    cell = cells[(x, y)] = set()
+                cell.add(obj)
+
+    def __discard(self, obj: Any, bounds: Tuple[int, int, int, int]) -> None:
+        """Removes an object from every cell inside the bounds, dropping empty cells."""
+        x0, y0, x1, y1 = bounds
+        cells = self._cells
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = cells[(x, y)]
+                cell.discard(obj)
+                if not cell:
+                    del cells[(x, y)]
@@ -9,3 +9,4 @@ from .decorators import run_every, event_listener
 from .engine import print_versions, error, warning, quit
 from .platform import get_platform, get_web_platform, is_web, is_local, is_windows, is_linux, is_mac, is_android
 from .python import get_filename, get_filetype, load_module, load_class
+from .cache import get_cache_path, load_cache, save_cache
@@ -0,0 +1,71 @@
+from .platform import is_web
+
+from typing import Any
+import json
+import os
+
+from pygame.system import get_pref_path
+
+__all__ = ["get_cache_path","load_cache","save_cache"]
+
+def get_cache_path(name: str, ext: str = "json") -> str | None:
+    """
+    Get the path of a cache file in the engine cache directory.
+
+    Args:
+        name (str): The cache name (without extension).
+        ext (str): The file extension. Defaults to "json".
+
+    Returns:
+        str | None: The path to the cache file, or None if there is no writable cache directory (e.g. on the web).
+    """
+    if is_web():
+        return None
+    try:
+        return os.path.join(get_pref_path("pyxora", ".cache"), f"{name}.{ext}")
+    except Exception:  # pygame.error when the preferences directory is not available
+        return None
+
+def load_cache(name: str) -> dict[str, Any]:
+    """
+    Load a cache file.
+
+    Args:
+        name (str): The cache name.
+
+    Returns:
+        dict[str, Any]: The cached data, or an empty dictionary if the cache is missing or invalid.
+    """
+    path = get_cache_path(name)
+    if path is None or not os.path.isfile(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def save_cache(name: str, data: dict[str, Any]) -> bool:
+    """
+    Save a cache file, a cache is optional so failing to write it is not an error.
+
+    Args:
+        name (str): The cache name.
+        data (dict[str, Any]): The JSON serializable data.
+
+    Returns:
+        bool: True if the cache was saved.
+    """
+    path = get_cache_path(name)
+    if path is None:
+        return False
+    try:
+        # write and rename, so a crash never leaves a half written cache
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(tmp_path, path)
+    except OSError:
+        return False
+    return True
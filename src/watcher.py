@@ -0,0 +1,172 @@
+from .utils import engine
+
+from time import perf_counter
+from typing import Iterable
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+
+# inotify(7) event flags
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+class FileWatcher:
+    """
+    Watches directories for changed files (created, modified, moved or deleted).
+
+    Uses inotify on Linux, so checking for changes every frame is a single non-blocking read.
+    On the other platforms (or if inotify is not available) the files are polled every `interval` seconds.
+    Meant for development, e.g. the asset hot-reload of `Assets.init(watch=True)`.
+    """
+
+    interval = 0.5
+    """The seconds between two scans of the polling fallback"""
+    ignore = {"__pycache__"}
+    """The directory names that are never watched"""
+
+    def __init__(self, paths: Iterable[str], polling: bool = False) -> None:
+        """
+        Initialize a watcher and start watching the directories (and their subdirectories).
+
+        Args:
+            paths (Iterable[str]): The directories to watch.
+            polling (bool): Always use the polling fallback. Defaults to False.
+        """
+        self._paths = [os.path.abspath(path) for path in paths]
+        self._fd = -1
+        self._dirs: dict[int, str] = {}  # inotify watch descriptor -> directory
+        self._files: dict[str, tuple[int, int]] = {}  # polling snapshot, path -> (mtime, size)
+        self._last_scan = perf_counter()
+
+        if not polling and sys.platform.startswith("linux"):
+            self.__init_inotify()
+        if self._fd < 0:
+            self._files = self.__scan()
+
+    def __repr__(self) -> str:
+        return f"<FileWatcher | backend: {self.backend}, paths: {len(self._paths)}>"
+
+    @property
+    def backend(self) -> str:
+        """The way the changes are detected, "inotify" or "polling"."""
+        return "inotify" if self._fd >= 0 else "polling"
+
+    def poll(self) -> set[str]:
+        """
+        Get the files that changed since the last call.
+
+        Returns:
+            set[str]: The absolute paths of the changed files, a deleted file is not on disk anymore.
+        """
+        if self._fd >= 0:
+            return self.__read_inotify()
+
+        now = perf_counter()
+        if now - self._last_scan < self.interval:
+            return set()
+        self._last_scan = now
+
+        files = self.__scan()
+        old = self._files
+        self._files = files
+        changed = {path for path, stat in files.items() if old.get(path) != stat}
+        changed.update(path for path in old if path not in files)
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._dirs.clear()
+        self._files.clear()
+
+    def __init_inotify(self) -> None:
+        """Starts watching the directories with inotify, leaves the watcher in polling mode if it fails."""
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+            self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            self._fd = -1
+            return
+
+        for path in self._paths:
+            self.__add_tree(path)
+
+    def __add_tree(self, path: str) -> None:
+        """Watches a directory and its subdirectories."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _IN_MASK)
+        if wd < 0:
+            engine.warning(f"Cannot watch {path}: {os.strerror(ctypes.get_errno())}")
+            return
+        self._dirs[wd] = path
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    entry.is_dir() and entry.name not in self.ignore and self.__add_tree(entry.path)
+        except OSError:
+            pass
+
+    def __read_inotify(self) -> set[str]:
+        """Reads the pending inotify events without blocking."""
+        changed = set()
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, size = _EVENT.unpack_from(buffer, offset)
+                name = buffer[offset + _EVENT.size:offset + _EVENT.size + size].rstrip(b"\x00")
+                offset += _EVENT.size + size
+
+                if mask & _IN_Q_OVERFLOW:
+                    engine.warning("Too many file changes at once, some were missed.")
+                    continue
+                if mask & _IN_IGNORED:
+                    self._dirs.pop(wd, None)  # the directory was removed
+                    continue
+
+                directory = self._dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name))
+                if mask & _IN_ISDIR:
+                    # a new directory, its files were created before it was watched
+                    if mask & (_IN_CREATE | _IN_MOVED_TO) and os.path.basename(path) not in self.ignore:
+                        self.__add_tree(path)
+                        changed.update(self.__list(path))
+                elif not mask & _IN_CREATE:  # a created file is reported when it is closed
+                    changed.add(path)
+
+    def __scan(self) -> dict[str, tuple[int, int]]:
+        """Returns the (mtime, size) of every watched file."""
+        files = {}
+        for path in self._paths:
+            for file in self.__list(path):
+                try:
+                    stat = os.stat(file)
+                except OSError:
+                    continue
+                files[file] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def __list(self, path: str) -> list[str]:
+        """Returns every file of a directory and its subdirectories."""
+        files = []
+        for root, dirs, names in os.walk(path):
+            dirs[:] = [name for name in dirs if name not in self.ignore]
+            files.extend(os.path.join(root, name) for name in names)
+        return files
@@ -7,6 +7,9 @@ It provides helper functions or classes that unify interfaces (such as vectors,
 from .shapes import Shape,Rect,Circle
 from .text import Text
 from .image import Image
+from .tilemap import Tilemap
+from .arrays import ShapeArray,SpriteArray
+from .particles import Particles
 from .music import Music
-from .sfx import SoundEffect
+from .sfx import SoundEffect,VoicePool
 from .functions import vector, rect
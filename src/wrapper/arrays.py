@@ -0,0 +1,342 @@
+from .functions import vector
+from .shapes import Rect,Circle
+from ..assets import Assets
+
+from abc import ABC, abstractmethod
+from typing import Tuple,Sequence
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency (pip install pyxora[arrays])
+    np = None
+
+class _Array(ABC):
+    """
+    @private
+    Base class for the struct-of-arrays containers.
+
+    Keeps the positions and velocities of many objects in NumPy arrays,
+    so moving, updating and culling them are single vectorized operations.
+    """
+
+    def __init__(self, positions: Sequence, velocities: Sequence | None = None) -> None:
+        """
+        Initializes the position and velocity arrays.
+
+        Args:
+            positions (Sequence): The (N, 2) positions.
+            velocities (Sequence, optional): The (N, 2) velocities in pixels per second. Defaults to zero.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError(f"{type(self).__name__} requires numpy (pip install pyxora[arrays]).")
+
+        self._positions = np.array(positions, dtype=np.float64).reshape(-1, 2)
+        count = len(self._positions)
+        if velocities is None:
+            self._velocities = np.zeros((count, 2))
+        else:
+            self._velocities = np.broadcast_to(np.asarray(velocities, dtype=np.float64), (count, 2)).copy()
+
+        # the origin of the array, so the camera can transform it like any other object
+        self._pos = vector(0, 0)
+        self._index = None
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def positions(self) -> "np.ndarray":
+        """The (N, 2) positions array, can be modified in place."""
+        return self._positions
+
+    @property
+    def velocities(self) -> "np.ndarray":
+        """The (N, 2) velocities array in pixels per second, can be modified in place."""
+        return self._velocities
+
+    @property
+    def rect(self) -> pygame.FRect:
+        """
+        Returns the bounding rectangle of all the objects.
+
+        Returns:
+            pygame.FRect: The bounding rectangle.
+        """
+        if not len(self):
+            return pygame.FRect(0, 0, 0, 0)
+        left, top, right, bottom = self._bounds()
+        x, y = left.min(), top.min()
+        return pygame.FRect(x, y, right.max() - x, bottom.max() - y)
+
+    def move(self, offset: Tuple[int | float, int | float] | Sequence) -> None:
+        """
+        Moves all the objects by an offset, or each one by its own (N, 2) offsets.
+
+        Args:
+            offset (Tuple[int | float, int | float] | Sequence): The offset(s) to move by.
+        """
+        self._positions += offset
+        self._index and self._index.update(self)
+
+    def move_at(self, positions: Sequence) -> None:
+        """
+        Moves the objects to new (N, 2) positions.
+
+        Args:
+            positions (Sequence): The new positions.
+        """
+        self._positions[:] = positions
+        self._index and self._index.update(self)
+
+    def update(self, dt: float) -> None:
+        """
+        Moves every object by its velocity.
+
+        Args:
+            dt (float): The elapsed time in seconds, e.g. `Scene.dt`.
+        """
+        self._positions += self._velocities * dt
+        self._index and self._index.update(self)
+
+    def visible(self, rect: pygame.Rect | pygame.FRect) -> "np.ndarray":
+        """
+        Get the indices of the objects that overlap an area, e.g. `Camera.rect`.
+
+        Args:
+            rect (pygame.Rect | pygame.FRect): The area to test against.
+
+        Returns:
+            np.ndarray: The indices of the overlapping objects.
+        """
+        left, top, right, bottom = self._bounds()
+        mask = (left < rect.right) & (right > rect.left) & (top < rect.bottom) & (bottom > rect.top)
+        return np.flatnonzero(mask)
+
+    def remove(self, indices: Sequence) -> None:
+        """
+        Remove objects by index (or by a boolean mask).
+
+        Args:
+            indices (Sequence): The indices of the objects to remove.
+        """
+        keep = np.ones(len(self), dtype=bool)
+        keep[indices] = False
+        self._keep(np.flatnonzero(keep))
+
+    def _keep(self, indices: "np.ndarray") -> None:
+        """Keeps only the objects at the given indices (`take` is much faster than boolean indexing)."""
+        self._positions = self._positions.take(indices, axis=0)
+        self._velocities = self._velocities.take(indices, axis=0)
+
+    @abstractmethod
+    def _bounds(self, scale: float = 1, offset: Tuple[float, float] = (0, 0)) -> tuple:
+        """Returns the (left, top, right, bottom) arrays of every object, scaled and offset."""
+        pass
+
+    @staticmethod
+    def _blit(surf: pygame.Surface, sprites: Sequence, keys: "np.ndarray", left: "np.ndarray", top: "np.ndarray") -> pygame.Rect:
+        """Blits the sprite of every object in a single call and returns the drawn area."""
+        if not len(keys):
+            return pygame.Rect(0, 0, 0, 0)
+        table = np.empty(len(sprites), dtype=object)
+        table[:] = sprites
+        surf.fblits(zip(table[keys].tolist(), zip(left.tolist(), top.tolist())))
+
+        sizes = np.array([sprite.get_size() if sprite else (0, 0) for sprite in sprites]).reshape(-1, 2)
+        right = left + sizes[keys, 0]
+        bottom = top + sizes[keys, 1]
+        x, y = int(left.min()), int(top.min())
+        return pygame.Rect(x, y, int(right.max()) - x + 1, int(bottom.max()) - y + 1).clip(surf.get_clip())
+
+
+class ShapeArray(_Array):
+    """
+    Many rectangles or circles stored as NumPy arrays of positions, sizes, colors and velocities.
+
+    Moving and culling are vectorized and drawing is a single `fblits` call of the cached shape sprites.
+    Draw it with `camera.draw_array(array)`.
+    """
+
+    def __init__(
+            self,
+            positions: Sequence,
+            sizes: Sequence | int | float,
+            colors: Sequence | str | tuple,
+            kind: str = "circle",
+            velocities: Sequence | None = None
+    ) -> None:
+        """
+        Initializes a ShapeArray object.
+
+        Args:
+            positions (Sequence): The (N, 2) positions, the centers for circles and the top-left corners for rectangles.
+            sizes (Sequence | int | float): The radius of every circle, or the (width, height) of every rectangle.
+            colors (Sequence | str | tuple): A single color for all the shapes, or (N, 3)/(N, 4) RGB(A) values.
+            kind (str): The shape kind, "circle" or "rect". Default = circle
+            velocities (Sequence, optional): The (N, 2) velocities in pixels per second. Defaults to zero.
+
+        Raises:
+            ValueError: If the shape kind is not supported.
+        """
+        if kind not in ("circle", "rect"):
+            raise ValueError(f"Invalid shape kind: {kind}")
+        super().__init__(positions, velocities)
+
+        count = len(self._positions)
+        shape = (count,) if kind == "circle" else (count, 2)
+        self._kind = kind
+        self._sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float64), shape).copy()
+        self._colors = self.__to_colors(colors, count)
+
+    @property
+    def kind(self) -> str:
+        """The shape kind, "circle" or "rect"."""
+        return self._kind
+
+    @property
+    def sizes(self) -> "np.ndarray":
+        """The (N,) radius or (N, 2) size array, can be modified in place."""
+        return self._sizes
+
+    @property
+    def colors(self) -> "np.ndarray":
+        """The (N, 4) RGBA colors array, can be modified in place."""
+        return self._colors
+
+    def draw(self, surf: pygame.Surface, fill: int, scale: int | float, pos: Tuple[int | float, int | float] | None = None) -> pygame.Rect:
+        """
+        Draws the shapes that are inside the surface with a single blit call.
+
+        Args:
+            surf (pygame.Surface): The surface to draw on.
+            fill (int): The fill value for the shapes (positive values for outline else is solid).
+            scale (int | float): The scale factor for the shapes.
+            pos (Tuple[int | float, int | float], optional): The screen position of the array origin. Defaults to (0, 0).
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
+        """
+        offset = (self._pos.x, self._pos.y) if pos is None else pos
+        fill = int(np.ceil(fill * scale)) if fill > 0 else 0
+
+        left, top, right, bottom = self._bounds(scale, offset)
+        clip = surf.get_clip()
+        visible = np.flatnonzero((left < clip.right) & (right > clip.left) & (top < clip.bottom) & (bottom > clip.top))
+
+        # one sprite for every different (pixel size, color), packed into a single int64 key
+        rgba = self._colors[visible].astype(np.int64)
+        packed = (rgba[:, 0] << 24) | (rgba[:, 1] << 16) | (rgba[:, 2] << 8) | rgba[:, 3]
+        if self._kind == "circle":
+            diameters = np.maximum(1, np.ceil(self._sizes[visible] * 2 * scale)).astype(np.int64)
+            packed |= diameters << 32
+        else:
+            sizes = np.maximum(1, np.round(self._sizes[visible] * scale)).astype(np.int64)
+            packed |= (sizes[:, 0] << 48) | (sizes[:, 1] << 32)
+        unique, keys = np.unique(packed, return_inverse=True)
+
+        sprites = []
+        for key in unique.tolist():
+            color = ((key >> 24) & 255, (key >> 16) & 255, (key >> 8) & 255, key & 255)
+            if self._kind == "circle":
+                sprites.append(Circle._sprite(key >> 32, color, fill))
+            else:
+                sprites.append(Rect._sprite(((key >> 48) & 65535, (key >> 32) & 65535), color, fill))
+
+        return self._blit(surf, sprites, keys.reshape(-1), left[visible], top[visible])
+
+    def _keep(self, indices: "np.ndarray") -> None:
+        super()._keep(indices)
+        self._sizes = self._sizes.take(indices, axis=0)
+        self._colors = self._colors.take(indices, axis=0)
+
+    def _bounds(self, scale: float = 1, offset: Tuple[float, float] = (0, 0)) -> tuple:
+        x = self._positions[:, 0] * scale + offset[0]
+        y = self._positions[:, 1] * scale + offset[1]
+        if self._kind == "circle":
+            radius = self._sizes * scale
+            return x - radius, y - radius, x + radius, y + radius
+        return x, y, x + self._sizes[:, 0] * scale, y + self._sizes[:, 1] * scale
+
+    @staticmethod
+    def __to_colors(colors: Sequence | str | tuple, count: int) -> "np.ndarray":
+        """Converts a single color or (N, 3)/(N, 4) values to an (N, 4) uint8 RGBA array."""
+        if isinstance(colors, (str, pygame.Color)) or (len(colors) in (3, 4) and np.ndim(colors) == 1):
+            colors = tuple(pygame.Color(colors))
+        colors = np.asarray(colors, dtype=np.uint8)
+        if colors.shape[-1] == 3:
+            colors = np.concatenate([colors, np.full(colors.shape[:-1] + (1,), 255, dtype=np.uint8)], axis=-1)
+        return np.broadcast_to(colors, (count, 4)).copy()
+
+
+class SpriteArray(_Array):
+    """
+    Many sprites stored as NumPy arrays of positions, frames and velocities.
+
+    Moving and culling are vectorized and drawing is a single `fblits` call.
+    Draw it with `camera.draw_array(array)`.
+    """
+
+    def __init__(
+            self,
+            surfaces: pygame.Surface | Sequence[pygame.Surface],
+            positions: Sequence,
+            frames: Sequence | int = 0,
+            velocities: Sequence | None = None
+    ) -> None:
+        """
+        Initializes a SpriteArray object.
+
+        Args:
+            surfaces (pygame.Surface | Sequence[pygame.Surface]): The sprite surface, or a list of surfaces (frames).
+            positions (Sequence): The (N, 2) top-left positions.
+            frames (Sequence | int): The surface index of every sprite. Default = 0
+            velocities (Sequence, optional): The (N, 2) velocities in pixels per second. Defaults to zero.
+        """
+        super().__init__(positions, velocities)
+        self._surfaces = [surfaces] if isinstance(surfaces, pygame.Surface) else list(surfaces)
+        self._frames = np.broadcast_to(np.asarray(frames, dtype=np.int64), (len(self._positions),)).copy()
+
+    @property
+    def surfaces(self) -> list:
+        """The list of sprite surfaces."""
+        return self._surfaces
+
+    @property
+    def frames(self) -> "np.ndarray":
+        """The (N,) surface index array, can be modified in place."""
+        return self._frames
+
+    def draw(self, surf: pygame.Surface, scale: float, pos: Tuple[int | float, int | float] | None = None) -> pygame.Rect:
+        """
+        Draws the sprites that are inside the surface with a single blit call.
+
+        Args:
+            surf (pygame.Surface): The surface to draw on.
+            scale (float): The scale factor to apply to the sprites.
+            pos (Tuple[int | float, int | float], optional): The screen position of the array origin. Defaults to (0, 0).
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
+        """
+        offset = (self._pos.x, self._pos.y) if pos is None else pos
+        left, top, right, bottom = self._bounds(scale, offset)
+        clip = surf.get_clip()
+        visible = np.flatnonzero((left < clip.right) & (right > clip.left) & (top < clip.bottom) & (bottom > clip.top))
+
+        sprites = [Assets.get_scaled(surface, scale) for surface in self._surfaces]
+        return self._blit(surf, sprites, self._frames[visible], left[visible], top[visible])
+
+    def _keep(self, indices: "np.ndarray") -> None:
+        super()._keep(indices)
+        self._frames = self._frames.take(indices, axis=0)
+
+    def _bounds(self, scale: float = 1, offset: Tuple[float, float] = (0, 0)) -> tuple:
+        sizes = np.array([surface.get_size() for surface in self._surfaces], dtype=np.float64).reshape(-1, 2)
+        x = self._positions[:, 0] * scale + offset[0]
+        y = self._positions[:, 1] * scale + offset[1]
+        return x, y, x + sizes[self._frames, 0] * scale, y + sizes[self._frames, 1] * scale
@@ -1,4 +1,5 @@
 from .functions import vector
+from ..assets import Assets
 
 from typing import Union,Tuple
 
@@ -21,7 +22,10 @@ class Image:
             Available Alignments: topleft, topright, midtop, midleft, center, midright, bottomleft, midbottom, bottomright
         """
         self._surface = image
+        self._source = image  # the loaded surface, before the custom size
+        self._custom_size = custom_size
         self._pos = vector(*pos)
+        self._index = None  # the SpatialHash the object is registered to
         self._size = self.rect.size
 
         # custom_size = scale
@@ -33,6 +37,7 @@ class Image:
 
         self._scale = 1.0
         self._scale_surface = None
+        Assets._watcher is not None and Assets._images.add(self)  # a resized hot-reload swaps the surface
 
         shape_type == 2 and self.__apply_circular_mask()
 
@@ -114,6 +119,7 @@ class Image:
         """
         self._pos.x += pos[0]
         self._pos.y += pos[1]
+        self._index and self._index.update(self)
 
     def move_at(self,pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3) -> None:
         """
@@ -125,8 +131,9 @@ class Image:
         """
         self._pos.x = pos[0]
         self._pos.y = pos[1]
+        self._index and self._index.update(self)
 
-    def draw(self,surf: pygame.Surface,scale: float) -> None:
+    def draw(self,surf: pygame.Surface,scale: float,pos: Tuple[int | float, int | float] | None = None) -> pygame.Rect:
         """
         Draws the image on the given surface.
 
@@ -135,16 +142,51 @@ class Image:
                 The surface to draw the image on.
             scale (float):
                 The scale factor to apply to the image.
+            pos (Tuple[int | float, int | float], optional):
+                The screen position to draw at. Defaults to the image position.
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
+        """
+        return surf.blit(self._get_surface(scale), self._pos if pos is None else pos)
+
+    def _get_surface(self,scale: float) -> pygame.Surface:
+        """
+        Returns the image surface for the given scale.
+
+        The scaled surfaces come from the shared mipmap pyramid of the source surface (see `Assets.get_scaled`).
+
+        Args:
+            scale (float):
+                The scale factor to apply to the image.
+
+        Returns:
+            pygame.Surface: The (scaled) image surface.
         """
         if scale == 1:
-            surf.blit(self._surface, self._pos)
-            return
+            return self._surface
 
         if not self._scale == scale:
-            self._scale_surface = pygame.transform.smoothscale_by(self._surface, scale)
+            self._scale_surface = Assets.get_scaled(self._surface, scale)
             self._scale = scale
 
-        surf.blit(self._scale_surface, self._pos)
+        return self._scale_surface
+
+    def _set_surface(self, surface: pygame.Surface) -> None:
+        """
+        @private
+        Replaces the image surface, keeping the top-left position and the custom size (used by the asset hot-reload).
+
+        Args:
+            surface (pygame.Surface): The new image surface.
+        """
+        self._source = surface
+        custom_size = self._custom_size
+        self._surface = pygame.transform.smoothscale(surface, custom_size) if custom_size else surface
+        self._size = custom_size or surface.get_size()
+        self._scale = 1.0
+        self._scale_surface = None
+        self._index and self._index.update(self)
 
     def __apply_circular_mask(self) -> None:
         """Applies a circular alpha mask to the surface."""
@@ -1,4 +1,5 @@
 from ..utils import engine
+from ..pack import Pack
 import pygame
 
 class Music:
@@ -39,7 +40,7 @@ class Music:
     @property
     def metadata(self) -> dict:
         """The metadata of the music."""
-        return pygame.mixer.music.get_metadata(self._path)
+        return pygame.mixer.music.get_metadata(Pack.get_file(self._path), self._path)
 
     @classmethod
     def change_volume(cls,value: float) -> None:
@@ -66,7 +67,7 @@ class Music:
 
             fade_ms (int): Milliseconds to fade in the music.
         """
-        pygame.mixer.music.load(self._path)
+        pygame.mixer.music.load(Pack.get_file(self._path), self._path)
         pygame.mixer.music.set_volume(self.volume)
         pygame.mixer.music.play(loops+1,start,fade_ms)
         Music._active = self
@@ -0,0 +1,143 @@
+from .arrays import _Array,np
+from .shapes import Circle
+
+from typing import Tuple,Sequence
+
+import pygame
+
+class Particles(_Array):
+    """
+    A particle emitter, e.g. for smoke, sparks and explosions.
+
+    The state of every particle (position, velocity, lifetime, color and size) lives in NumPy arrays,
+    so `update` is a single vectorized step and drawing is a single `fblits` call of cached circle sprites.
+    Over its lifetime a particle goes through the colors of the palette and from the start to the end size.
+    Draw it with `camera.draw_array(particles)`.
+    """
+
+    def __init__(
+            self,
+            colors: Sequence[str | tuple] = ("white",),
+            size: Tuple[int | float, int | float] = (4, 0),
+            lifetime: Tuple[float, float] = (0.5, 1),
+            speed: Tuple[int | float, int | float] = (50, 150),
+            angle: Tuple[int | float, int | float] = (0, 360),
+            gravity: Tuple[int | float, int | float] = (0, 0)
+    ) -> None:
+        """
+        Initializes an empty Particles emitter.
+
+        Args:
+            colors (Sequence[str | tuple]): The color palette, from the birth to the death of a particle. Default = ("white",)
+            size (Tuple[int | float, int | float]): The start and end radius of a particle. Default = (4, 0)
+            lifetime (Tuple[float, float]): The min and max lifetime of a particle in seconds. Default = (0.5, 1)
+            speed (Tuple[int | float, int | float]): The min and max start speed in pixels per second. Default = (50, 150)
+            angle (Tuple[int | float, int | float]): The min and max emit angle in degrees. Default = (0, 360)
+            gravity (Tuple[int | float, int | float]): The acceleration of the particles in pixels per second². Default = (0, 0)
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        super().__init__(np.empty((0, 2)) if np is not None else ())
+        self._palette = [tuple(pygame.Color(color)) for color in colors]
+        self._size = size
+        self._lifetime = lifetime
+        self._speed = speed
+        self._angle = angle
+        self._gravity = np.array(gravity, dtype=np.float64)
+        self._life = np.empty(0)  # remaining lifetime
+        self._total = np.empty(0)  # full lifetime
+        self._rng = np.random.default_rng()
+
+    def emit(self, count: int, pos: Tuple[int | float, int | float] | pygame.math.Vector2) -> None:
+        """
+        Spawns new particles.
+
+        Args:
+            count (int): The number of particles to spawn.
+            pos (Tuple[int | float, int | float] | pygame.math.Vector2): The spawn position.
+        """
+        rng = self._rng
+        angles = np.radians(rng.uniform(*self._angle, count))
+        speeds = rng.uniform(*self._speed, count)
+        velocities = np.column_stack((np.cos(angles) * speeds, np.sin(angles) * speeds))
+        life = rng.uniform(*self._lifetime, count)
+
+        self._positions = np.concatenate((self._positions, np.broadcast_to((pos[0], pos[1]), (count, 2))))
+        self._velocities = np.concatenate((self._velocities, velocities))
+        self._life = np.concatenate((self._life, life))
+        self._total = np.concatenate((self._total, life))
+
+    def update(self, dt: float) -> None:
+        """
+        Moves the particles and removes the dead ones.
+
+        Args:
+            dt (float): The elapsed time in seconds, e.g. `Scene.dt`.
+        """
+        if not len(self):
+            return
+        self._life -= dt
+        alive = self._life > 0
+        alive.all() or self._keep(np.flatnonzero(alive))
+        self._velocities += self._gravity * dt
+        self._positions += self._velocities * dt
+
+    def clear(self) -> None:
+        """Removes all the particles."""
+        self._keep(np.empty(0, dtype=np.int64))
+
+    def draw(self, surf: pygame.Surface, scale: float, pos: Tuple[int | float, int | float] | None = None) -> pygame.Rect:
+        """
+        Draws the particles that are inside the surface with a single blit call.
+
+        Args:
+            surf (pygame.Surface): The surface to draw on.
+            scale (float): The scale factor to apply to the particles.
+            pos (Tuple[int | float, int | float], optional): The screen position of the emitter origin. Defaults to (0, 0).
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
+        """
+        offset = (self._pos.x, self._pos.y) if pos is None else pos
+        age = self.__age()
+        radius = self.__radius(age) * scale
+        x = self._positions[:, 0] * scale + offset[0]
+        y = self._positions[:, 1] * scale + offset[1]
+
+        clip = surf.get_clip()
+        visible = (x + radius > clip.left) & (x - radius < clip.right) & (y + radius > clip.top) & (y - radius < clip.bottom)
+        visible &= radius > 0
+
+        # one sprite for every (diameter, palette color), the key is a small int so a lookup table is enough
+        count = len(self._palette)
+        diameters = np.maximum(1, np.ceil(radius[visible] * 2)).astype(np.int64)
+        colors = np.minimum(age[visible] * count, count - 1).astype(np.int64)
+        keys = diameters * count + colors
+
+        sprites = np.empty(int(keys.max()) + 1 if len(keys) else 0, dtype=object)
+        for key in np.flatnonzero(np.bincount(keys)).tolist():
+            sprites[key] = Circle._sprite(key // count, self._palette[key % count], 0)
+
+        half = diameters / 2
+        return self._blit(surf, sprites, keys, x[visible] - half, y[visible] - half)
+
+    def _keep(self, indices: "np.ndarray") -> None:
+        super()._keep(indices)
+        self._life = self._life.take(indices, axis=0)
+        self._total = self._total.take(indices, axis=0)
+
+    def _bounds(self, scale: float = 1, offset: Tuple[float, float] = (0, 0)) -> tuple:
+        radius = self.__radius(self.__age()) * scale
+        x = self._positions[:, 0] * scale + offset[0]
+        y = self._positions[:, 1] * scale + offset[1]
+        return x - radius, y - radius, x + radius, y + radius
+
+    def __age(self) -> "np.ndarray":
+        """Returns the age of every particle, from 0 (birth) to 1 (death)."""
+        return 1 - self._life / self._total
+
+    def __radius(self, age: "np.ndarray") -> "np.ndarray":
+        """Returns the radius of every particle for its age."""
+        start, end = self._size
+        return start + (end - start) * age
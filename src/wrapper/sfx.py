@@ -1,18 +1,157 @@
+from time import perf_counter
+from weakref import WeakKeyDictionary
+
 import pygame
 
+class VoicePool:
+    """
+    Manages the mixer channels (voices) of the sound effects.
+
+    The channels are split into groups, e.g. a few reserved for the UI so they are never taken by explosions.
+    A sound effect plays on a free channel of its group; if there is none, it takes the voice with the
+    lowest priority (the oldest first) that is not higher than its own, or it is dropped.
+    An effect can also cap its own overlapping instances, and the same sound played again
+    within `dedupe_ms` (by any of its effects) is skipped, so a busy scene never floods the mixer.
+
+    Example:
+        VoicePool.init(channels=32, groups={"ui": 4, "steps": 6})
+        jump = SoundEffect(Assets.get("data", "sfx", "jump"), group="player", max_voices=2)
+    """
+
+    dedupe_ms = 10
+    """The milliseconds in which a second play of the same sound is skipped"""
+    _groups: dict[str, int] = {}
+    """@private The reserved channel count of every group"""
+    _layout: dict[str, range] | None = None
+    """@private The channel indices of every group, the "default" group has the unreserved ones"""
+    _channels: list[pygame.mixer.Channel] = []
+    _voices: list[tuple[int, float]] = []  # the (priority, start time) of the voice of every channel
+    _last_play: WeakKeyDictionary = WeakKeyDictionary()  # the last play time of every sound, shared by its effects
+
+    @classmethod
+    def init(cls, channels: int | None = None, groups: dict[str, int] | None = None) -> None:
+        """
+        Set the number of mixer channels and reserve channels for groups.
+
+        Args:
+            channels (int, optional): The total number of channels. Defaults to the current mixer channels.
+            groups (dict[str, int], optional): The channels reserved for every group,
+                the effects of the other groups share the remaining "default" channels. Defaults to no groups.
+        """
+        channels is not None and pygame.mixer.set_num_channels(channels)
+        cls._groups = dict(groups or {})
+        cls._layout = None
+
+    @classmethod
+    def play(cls, effect: "SoundEffect", loops: int = 0, maxtime: int = 0, fade_ms: int = 0) -> pygame.mixer.Channel | None:
+        """
+        Play a sound effect on a voice of its group.
+
+        Args:
+            effect (SoundEffect): The sound effect.
+            loops (int): The number of times to repeat the sound after the first play (pygame loops).
+            maxtime (int): Max milliseconds to play the sound.
+            fade_ms (int): Milliseconds to fade in the sound.
+
+        Returns:
+            pygame.mixer.Channel | None: The channel of the voice, or None if the play was skipped or dropped.
+        """
+        now = perf_counter()
+        sound = effect._effect
+        if (now - cls._last_play.get(sound, float("-inf"))) * 1000 < cls.dedupe_ms:
+            return None
+
+        layout = cls.__get_layout()
+        indices = layout.get(effect._group) or layout["default"]
+
+        free, own, victim = None, [], None
+        for index in indices:
+            channel = cls._channels[index]
+            if not channel.get_busy():
+                free = index if free is None else free
+                continue
+            if channel.get_sound() is sound:
+                own.append(index)
+            # the lowest priority, then the oldest voice
+            if victim is None or cls._voices[index] < cls._voices[victim]:
+                victim = index
+
+        if effect._max_voices is not None and len(own) >= effect._max_voices:
+            target = min(own, key=lambda index: cls._voices[index][1])  # restart its oldest instance
+        elif free is not None:
+            target = free
+        elif victim is not None and cls._voices[victim][0] <= effect._priority:
+            target = victim
+        else:
+            return None  # every voice is more important
+
+        channel = cls._channels[target]
+        channel.play(sound, loops, maxtime, fade_ms)
+        cls._voices[target] = (effect._priority, now)
+        cls._last_play[sound] = now
+        return channel
+
+    @classmethod
+    def get_voices(cls, group: str = "default") -> int:
+        """
+        Get the number of playing voices of a group.
+
+        Args:
+            group (str): The group name. Defaults to "default".
+
+        Returns:
+            int: The number of busy channels of the group.
+        """
+        indices = cls.__get_layout().get(group, ())
+        return sum(cls._channels[index].get_busy() for index in indices)
+
+    @classmethod
+    def __get_layout(cls) -> dict[str, range]:
+        """Returns the channel layout, split again if the channel count changed (e.g. by `pygame.mixer.set_num_channels`)."""
+        if cls._layout is None or len(cls._channels) != pygame.mixer.get_num_channels():
+            cls.__update_layout()
+        return cls._layout
+
+    @classmethod
+    def __update_layout(cls) -> None:
+        """Splits the mixer channels into the groups."""
+        total = pygame.mixer.get_num_channels()
+        reserved = min(total, sum(cls._groups.values()))
+        # the reserved channels are never picked by plain `Sound.play` calls
+        pygame.mixer.set_reserved(reserved)
+
+        layout, start = {}, 0
+        for group, count in cls._groups.items():
+            count = min(count, total - start)
+            layout[group] = range(start, start + count)
+            start += count
+        layout["default"] = range(start, total)
+
+        cls._layout = layout
+        cls._channels = [pygame.mixer.Channel(index) for index in range(total)]
+        cls._voices = [(0, 0.0)] * total
+
+
 class SoundEffect:
     _volume = 1.0
 
-    def __init__(self, effect:pygame.mixer.Sound, volume:float = 1.0) -> None:
+    def __init__(self, effect:pygame.mixer.Sound, volume:float = 1.0, group: str = "default", max_voices: int | None = None, priority: int = 0) -> None:
         """
         Initialize a SoundEffect object
 
         Args:
             effect (pygame.mixer.Sound): The sound effect.
             volume (float): The volume level of the music.
+            group (str): The voice group of the effect, see `VoicePool.init`. Default = "default"
+            max_voices (int, optional): The max instances of the effect playing at once, a new play restarts the oldest.
+                Defaults to no limit (the instances overlap).
+            priority (int): The voice priority, a higher priority effect can take the voice of a lower one. Default = 0
         """
         self._effect = effect
         self._local_volume = volume
+        self._group = group
+        self._max_voices = max_voices
+        self._priority = priority
 
     @property
     def playing(self) -> bool:
@@ -50,9 +189,9 @@ class SoundEffect:
         self._local_volume = value
         self._effect.set_volume(self.volume)
 
-    def play(self,loops:int = -1, maxtime:int = 0, fade_ms:int = 0) -> None:
+    def play(self,loops:int = -1, maxtime:int = 0, fade_ms:int = 0) -> pygame.mixer.Channel | None:
         """
-        Starts the sound effect.
+        Starts the sound effect on a voice of its group, see `VoicePool`.
 
         Parameters:
             loops (int): Number of times to repeat the sound effect after the first play.
@@ -63,9 +202,11 @@ class SoundEffect:
             maxtime (int): Max Milliseconds to play the sound effect.
 
             fade_ms (int): Milliseconds to fade in the sound effect.
+
+        Returns:
+            pygame.mixer.Channel | None: The channel it plays on, or None if the play was skipped (see `VoicePool.play`).
         """
-        self._effect.stop()  # stop and play a new one
-        self._effect.play(loops+1,maxtime,fade_ms)
+        return VoicePool.play(self, loops+1, maxtime, fade_ms)
 
     def stop(self) -> None:
         """
@@ -1,11 +1,21 @@
 from .functions import vector
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from math import ceil
 from typing import Tuple
 import pygame
 
 class Shape(ABC):
-    """Abstract base class for all drawable shapes."""
+    """
+    Abstract base class for all drawable shapes.
+
+    Shapes are rasterized once into small sprites, cached by (kind, pixel size, color, fill),
+    so drawing many equal shapes is just blitting the same sprite.
+    """
+
+    sprites: dict = OrderedDict()
+    """The rasterized sprites cache (least recently used first)"""
+    _cache_limit = 10000  # default sprite cache limit is 10000
 
     def __init__(self, pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3, color: str | tuple):
         """
@@ -16,7 +26,38 @@ class Shape(ABC):
             color (str | tuple): The color of the shape, either as a string (e.g., "red") or a tuple (R, G, B).
         """
         self._pos = vector(*pos)
+        self._index = None  # the SpatialHash the object is registered to
         self._color = color
+        self._rgba = tuple(pygame.Color(color))  # resolve the color only once
+        self._rect = None  # cached bounding rect, reset when the shape moves
+
+    @classmethod
+    def set_cache(cls,new_limit: int) -> None:
+        """
+        Set the maximum number of cached sprites.
+        Note: Default is 10000, but can be increased or decreased as needed.
+
+        Args:
+            new_limit (int): New cache size limit.
+        """
+        cls._cache_limit = new_limit
+
+    @classmethod
+    def get_cache(cls) -> int:
+        """
+        Get the number of cached sprites.
+
+        Returns:
+            int: The number of cached sprites.
+        """
+        return len(cls.sprites)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clear all cached shape sprites.
+        """
+        cls.sprites.clear()
 
     @property
     def position(self) -> pygame.math.Vector2 | pygame.math.Vector3:
@@ -40,7 +81,7 @@ class Shape(ABC):
         pass
 
     @abstractmethod
-    def draw(self, surf: pygame.Surface, fill: int, scale: int | float) -> None:
+    def draw(self, surf: pygame.Surface, fill: int, scale: int | float, pos: Tuple[int | float, int | float] | None = None) -> pygame.Rect:
         """
         Abstract method to draw the shape on a surface with a given fill and scale.
 
@@ -48,6 +89,10 @@ class Shape(ABC):
             surf (pygame.Surface): The surface to draw on.
             fill (int): The fill value for the shape (positive values for outline else is solid).
             scale (int | float): The scale factor for the shape size.
+            pos (Tuple[int | float, int | float], optional): The screen position to draw at. Defaults to the shape position.
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
         """
         pass
 
@@ -61,6 +106,8 @@ class Shape(ABC):
         """
         self._pos.x += pos[0]
         self._pos.y += pos[1]
+        self._rect = None
+        self._index and self._index.update(self)
 
     def move_at(self,pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3) -> None:
         """
@@ -72,6 +119,42 @@ class Shape(ABC):
         """
         self._pos.x = pos[0]
         self._pos.y = pos[1]
+        self._rect = None
+        self._index and self._index.update(self)
+
+    @classmethod
+    def _get_sprite(cls, key: tuple, size: Tuple[int, int], color: Tuple[int, int, int, int], rasterize) -> pygame.Surface:
+        """
+        Returns the cached sprite of a shape, rasterizing it on the first use.
+
+        Args:
+            key (tuple): The cache key (kind, pixel size, color, fill).
+            size (Tuple[int, int]): The sprite size.
+            color (Tuple[int, int, int, int]): The resolved shape color.
+            rasterize (Callable[[pygame.Surface], Any]): Draws the shape on the empty sprite.
+
+        Returns:
+            pygame.Surface: The shape sprite.
+        """
+        sprite = cls.sprites.get(key)
+        if sprite is not None:
+            cls.sprites.move_to_end(key)  # least recently used first, so eviction drops the idle sprites
+            return sprite
+
+        if color[3] == 255:
+            # opaque colors use a color key, which blits faster than per-pixel alpha
+            sprite = pygame.Surface(size)
+            background = (255 - color[0], 255 - color[1], 255 - color[2])
+            sprite.fill(background)
+            sprite.set_colorkey(background, pygame.RLEACCEL)
+        else:
+            sprite = pygame.Surface(size, pygame.SRCALPHA)
+        rasterize(sprite)
+
+        if len(cls.sprites) >= cls._cache_limit:
+            cls.sprites.popitem(last=False)
+        cls.sprites[key] = sprite
+        return sprite
 
 
 class Rect(Shape):
@@ -107,11 +190,12 @@ class Rect(Shape):
         Returns:
             pygame.Rect | pygame.FRect: The bounding rectangle of the shape.
         """
-        if all(isinstance(i, int) for i in (self._pos[0], self._pos[1], self._size[0], self._size[1])):
-            return pygame.Rect(self._pos, self._size)  # Use pygame.Rect if all values are integers
-        return pygame.FRect(self._pos, self._size)  # Use pygame.FRect otherwise
+        # the position is a Vector2, so its values are always floats
+        if self._rect is None:
+            self._rect = pygame.FRect(self._pos, self._size)
+        return self._rect.copy()
 
-    def draw(self, surf: pygame.Surface, fill: int, scale: int | float) -> None:
+    def draw(self, surf: pygame.Surface, fill: int, scale: int | float, pos: Tuple[int | float, int | float] | None = None) -> pygame.Rect:
         """
         Draws the rectangle on the surface with a given fill and scale.
 
@@ -119,17 +203,38 @@ class Rect(Shape):
             surf (pygame.Surface): The surface to draw on.
             fill (int): The fill value for the shape (positive values for outline else is solid).
             scale (int | float): The scale factor for the rectangle size.
+            pos (Tuple[int | float, int | float], optional): The screen position to draw at. Defaults to the rectangle position.
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
         """
         # Scale the rectangle and fill value
-        rect = self.rect
-        color = self.color
-        fill *= scale
-        rect.width *= scale
-        rect.height *= scale
-        fill = ceil(fill)  # Ensure fill is an integer
+        pos = self._pos if pos is None else pos
+        color = self._rgba
+        size = (max(1, round(self._size[0] * scale)), max(1, round(self._size[1] * scale)))
+        fill = ceil(fill * scale)  # Ensure fill is an integer
+        fill = fill if fill > 0 else 0
 
-        # Draw the rectangle
-        pygame.draw.rect(surf, color, rect, width=fill if fill > 0 else 0)
+        # Draw the cached rectangle sprite
+        return surf.blit(self._sprite(size, color, fill), pos)
+
+    @classmethod
+    def _sprite(cls, size: Tuple[int, int], color: Tuple[int, int, int, int], fill: int) -> pygame.Surface:
+        """
+        Returns the cached sprite of a rectangle.
+
+        Args:
+            size (Tuple[int, int]): The size of the rectangle in pixels.
+            color (Tuple[int, int, int, int]): The resolved color.
+            fill (int): The outline width, 0 for solid.
+
+        Returns:
+            pygame.Surface: The rectangle sprite.
+        """
+        return cls._get_sprite(
+            ("rect", size, color, fill), size, color,
+            lambda sprite: pygame.draw.rect(sprite, color, sprite.get_rect(), width=fill)
+        )
 
 
 class Circle(Shape):
@@ -160,11 +265,13 @@ class Circle(Shape):
         Returns:
             pygame.Rect: The bounding rectangle that encloses the circle.
         """
-        pos = (self._pos[0] - self.radius, self._pos[1] - self.radius)  # Top-left corner of the bounding rect
-        size = (self.radius * 2, self.radius * 2)  # Size of the bounding rectangle
-        return pygame.Rect(pos, size)
+        if self._rect is None:
+            pos = (self._pos[0] - self.radius, self._pos[1] - self.radius)  # Top-left corner of the bounding rect
+            size = (self.radius * 2, self.radius * 2)  # Size of the bounding rectangle
+            self._rect = pygame.Rect(pos, size)
+        return self._rect.copy()
 
-    def draw(self, surf: pygame.Surface, fill: int, scale: int | float) -> None:
+    def draw(self, surf: pygame.Surface, fill: int, scale: int | float, pos: Tuple[int | float, int | float] | None = None) -> pygame.Rect:
         """
         Draws the circle on the surface with a given fill and scale.
 
@@ -172,12 +279,37 @@ class Circle(Shape):
             surf (pygame.Surface): The surface to draw on.
             fill (int): The fill value for the circle outline (negative for outline, positive for solid).
             scale (int | float): The scale factor for the circle size.
+            pos (Tuple[int | float, int | float], optional): The screen position of the center. Defaults to the circle position.
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
         """
         # Scale the circle and fill value
-        pos = self._pos
-        fill *= scale
+        pos = self._pos if pos is None else pos
+        color = self._rgba
         radius = self.radius * scale  # Scale the radius
-        fill = ceil(fill)  # Ensure fill is an integer
+        fill = ceil(fill * scale)  # Ensure fill is an integer
+        fill = fill if fill > 0 else 0
+
+        # Draw the cached circle sprite, centered at the position
+        diameter = max(1, ceil(radius * 2))
+        return surf.blit(self._sprite(diameter, color, fill), (pos[0] - diameter / 2, pos[1] - diameter / 2))
+
+    @classmethod
+    def _sprite(cls, diameter: int, color: Tuple[int, int, int, int], fill: int) -> pygame.Surface:
+        """
+        Returns the cached sprite of a circle.
+
+        Args:
+            diameter (int): The diameter of the circle in pixels.
+            color (Tuple[int, int, int, int]): The resolved color.
+            fill (int): The outline width, 0 for solid.
 
-        # Draw the circle
-        pygame.draw.circle(surf, self.color, pos, radius, width=fill if fill > 0 else 0)
+        Returns:
+            pygame.Surface: The circle sprite.
+        """
+        radius = diameter / 2
+        return cls._get_sprite(
+            ("circle", diameter, color, fill), (diameter, diameter), color,
+            lambda sprite: pygame.draw.circle(sprite, color, (radius, radius), radius, width=fill)
+        )
@@ -1,19 +1,234 @@
 from .functions import vector
-from ..assets import Assets
-from ..utils import engine
+from ..assets import Assets,Font
 
-from typing import Union,Tuple
+from typing import Union,Tuple,List
 from collections import OrderedDict
+from functools import lru_cache
 
 import pygame
 
-text_sizes = {
-    1, 2, 4, 8, 10, 12,
-    14, 16, 18, 24, 32,
-    48, 64, 72, 96, 128,
-    144, 192, 256
-}
-"""The available text sizes"""
+@lru_cache(maxsize=4096)
+def _wrap(text: str, font: pygame.font.Font, width: int | None) -> Tuple[str, ...]:
+    """
+    Breaks a text into lines that fit a width, measuring without rendering.
+
+    The line breaks are cached per (text, font, width).
+
+    Args:
+        text (str): The text, new lines are kept.
+        font (pygame.font.Font): The font to measure with.
+        width (int | None): The maximum line width in pixels, None to break only at new lines.
+
+    Returns:
+        Tuple[str, ...]: The lines of the text.
+    """
+    paragraphs = text.split("\n")
+    if width is None:
+        return tuple(paragraphs)
+
+    measure = font.size
+    lines = []
+    for paragraph in paragraphs:
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if measure(candidate)[0] <= width:
+                line = candidate
+                continue
+
+            line and lines.append(line)
+            # break the words longer than the width at the last character that fits
+            while len(word) > 1 and measure(word)[0] > width:
+                low,high = 1,len(word) - 1
+                while low < high:
+                    middle = (low + high + 1) // 2
+                    if measure(word[:middle])[0] <= width:
+                        low = middle
+                    else:
+                        high = middle - 1
+                lines.append(word[:low])
+                word = word[low:]
+            line = word
+        lines.append(line)
+    return tuple(lines)
+
+class GlyphAtlas:
+    """
+    A surface with every rendered glyph of a font and color.
+
+    Each glyph is rendered once and packed in rows (shelves) of the atlas,
+    then any string is assembled by blitting the glyph areas next to each other.
+    The atlas grows in height when it is full, the glyph areas stay the same.
+
+    Opaque colors render the glyphs on a color key background, so assembling a string is a plain copy.
+    """
+
+    atlases: dict = {}
+    """The atlases cache, by (font, color)"""
+    _width = 512  # the atlas width in pixels, glyphs are packed left to right
+
+    def __init__(self, font: pygame.font.Font, color: Tuple[int, int, int, int]) -> None:
+        """
+        Initialize an empty glyph atlas.
+
+        Args:
+            font (pygame.font.Font): The font of the glyphs.
+            color (Tuple[int, int, int, int]): The RGBA color of the glyphs.
+        """
+        self._font = font
+        self._color = color
+        self._height = font.get_linesize()
+        # the inverse color as the color key, like the shape sprites
+        self._key = (255 - color[0], 255 - color[1], 255 - color[2]) if color[3] == 255 else None
+        self._surface = self.__new_atlas(self._height)
+        # per-pixel alpha glyphs are added on cleared areas, a normal blit would blend their alpha twice
+        self._flags = 0 if self._key else pygame.BLEND_RGBA_ADD
+        self._glyphs: dict[str, pygame.Rect] = {}
+        self._cursor = [0, 0]  # the next free position of the current shelf
+
+    @classmethod
+    def get(cls, font: pygame.font.Font, color: str | tuple) -> "GlyphAtlas":
+        """
+        Get the shared atlas of a font and color, creating it on first use.
+
+        Args:
+            font (pygame.font.Font): The font of the glyphs.
+            color (str or tuple): The color of the glyphs.
+
+        Returns:
+            GlyphAtlas: The glyph atlas.
+        """
+        color = tuple(pygame.Color(color))
+        atlas = cls.atlases.get((font, color))
+        if atlas is None:
+            atlas = cls.atlases[(font, color)] = cls(font, color)
+        return atlas
+
+    @property
+    def height(self) -> int:
+        """The line height of the glyphs."""
+        return self._height
+
+    @property
+    def memory(self) -> int:
+        """
+        Returns the memory size of the atlas in bytes.
+
+        Returns:
+            int: The memory size of the atlas surface.
+        """
+        width,height = self._surface.get_size()
+        return width * height * self._surface.get_bytesize()
+
+    def surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Creates an empty surface in the format of the atlas, to assemble strings in.
+
+        Args:
+            size (Tuple[int, int]): The size of the surface.
+
+        Returns:
+            pygame.Surface: The empty surface.
+        """
+        if self._key is None:
+            return pygame.Surface(size, pygame.SRCALPHA)
+        surface = pygame.Surface(size)
+        surface.fill(self._key)
+        surface.set_colorkey(self._key)
+        return surface
+
+    def clear(self, surf: pygame.Surface, area: pygame.Rect | Tuple[int, int, int, int]) -> None:
+        """
+        Clears an area of a surface created by `surface`.
+
+        Args:
+            surf (pygame.Surface): The surface to clear.
+            area (pygame.Rect | Tuple[int, int, int, int]): The area to clear.
+        """
+        surf.fill((0, 0, 0, 0) if self._key is None else self._key, area)
+
+    def glyphs(self, text: str) -> List[pygame.Rect]:
+        """
+        Get the atlas areas of the glyphs of a string, rendering the missing ones.
+
+        Args:
+            text (str): The string.
+
+        Returns:
+            List[pygame.Rect]: The area of every character in the atlas.
+        """
+        get = self._glyphs.get
+        return [get(char) or self.__add_glyph(char) for char in text]
+
+    def size(self, text: str) -> Tuple[int, int]:
+        """
+        Get the size of an assembled string.
+
+        Args:
+            text (str): The string to measure.
+
+        Returns:
+            Tuple[int, int]: The (width, height) of the string.
+        """
+        return (sum(area.width for area in self.glyphs(text)), self._height)
+
+    def render(self, surf: pygame.Surface, text: str | List[pygame.Rect], pos: Tuple[int, int] = (0, 0)) -> None:
+        """
+        Blits a string on a surface glyph by glyph, replacing the pixels under it.
+
+        Args:
+            surf (pygame.Surface): The surface to draw the string on, created by `surface`.
+            text (str | List[pygame.Rect]): The string to draw, or its glyph areas.
+            pos (Tuple[int, int]): The top-left position of the string. Defaults to (0, 0).
+        """
+        areas = self.glyphs(text) if isinstance(text, str) else text
+        atlas = self._surface
+        x, y = pos
+        blits = []
+        for area in areas:
+            blits.append((atlas, (x, y), area, self._flags))
+            x += area.width
+        if self._key is None:
+            self.clear(surf, (pos[0], y, x - pos[0], self._height))
+        surf.blits(blits, doreturn=False)
+
+    def __add_glyph(self, char: str) -> pygame.Rect:
+        """Renders a glyph into the atlas and returns its area."""
+        width = self._font.size(char)[0]
+        if not width:  # nothing to render, e.g. a zero width joiner
+            area = self._glyphs[char] = pygame.Rect(0, 0, 0, self._height)
+            return area
+
+        glyph = self._font.render(char, False, self._color, self._key)
+        width = glyph.get_width()
+        x, y = self._cursor
+        if x + width > self._width:  # start a new shelf
+            x, y = 0, y + self._height
+        if y + self._height > self._surface.get_height():
+            self.__grow()
+
+        # a color key glyph (no antialiasing) is copied with a plain blit, which skips its key pixels,
+        # the additive copy would ignore the color key and add the key color boxes to the atlas
+        flags = self._flags if glyph.get_flags() & pygame.SRCALPHA else 0
+        self._surface.blit(glyph, (x, y), special_flags=flags)
+        area = self._glyphs[char] = pygame.Rect(x, y, width, self._height)
+        self._cursor = [x + width, y]
+        return area
+
+    def __new_atlas(self, height: int) -> pygame.Surface:
+        """Creates an empty atlas surface, the color key background is copied with the glyphs (no color key)."""
+        if self._key is None:
+            return pygame.Surface((self._width, height), pygame.SRCALPHA)
+        surface = pygame.Surface((self._width, height))
+        surface.fill(self._key)
+        return surface
+
+    def __grow(self) -> None:
+        """Doubles the height of the atlas, keeping the glyphs in place."""
+        old = self._surface
+        self._surface = self.__new_atlas(old.get_height() * 2)
+        self._surface.blit(old, (0, 0), special_flags=self._flags)
+
 
 class Text:
     """
@@ -24,10 +239,12 @@ class Text:
     """
 
     surfaces: dict = OrderedDict()
-    """The surfaces cache"""
-    _cache_limit = 10000  # default surface cache limit is 10000
+    """The surfaces cache (least recently used first), by (font, text, color)"""
+    _cache_limit = 64 * 1024 * 1024  # default surface cache limit is 64 MiB
+    _cache_memory = 0  # the bytes of all the cached surfaces
+    _cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
 
-    def __init__(self,text: str,pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3,color: str | tuple, font_name: str = pygame.font.get_default_font().split(".")[0],size: int = 24,align: str = "left") -> None:
+    def __init__(self,text: str,pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3,color: str | tuple, font_name: str = pygame.font.get_default_font().split(".")[0],size: int = 24,align: str = "left",atlas: bool = False,max_width: int | None = None) -> None:
         """
         Initialize a Text object.
 
@@ -38,23 +255,32 @@ class Text:
             font_name (str): The text font name.
             size (int): Font size.
             align (str): Alignment of the text: "left", "center", or "right".
+            atlas (bool): Assemble the text from a shared glyph atlas instead of rendering the whole string.
+                Use it for strings that change often (fps counters, scores, timers). Defaults to False.
+            max_width (int, optional): Word wrap the text to this width in pixels.
+                New lines always start a new line and the whole paragraph is rendered in one surface.
         """
-        size = self.__fix_size(size)
-        font = self.__get_font(font_name,size)
+        family = self.__get_family(font_name)
+        font = family.get(size)
 
         self._text = text
         self._pos = vector(*pos)
+        self._index = None  # the SpatialHash the object is registered to
         self._color = color
+        self._rgba = tuple(pygame.Color(color))
         self._font_name = font_name
 
+        self._family = family
         self._font = font
         self._size = size
 
-        self._zoom = 1
-        self._zoom_surface = None  # cache the zoom_surface for performance
+        self._align = align
+        self._max_width = max_width
+        self._lines = ()  # the laid out lines of the text
+        self._atlas = GlyphAtlas.get(font,color) if atlas else None
+        self._buffer = None  # the surface the atlas strings are assembled in, reused by set_text
 
-        # Initialize the surface cache
-        self._cache_surface() if (font,text) not in self.surfaces else setattr(self,"_surface",self.surfaces[(font,text)])
+        self.__update_surface()
 
         # change the position of the text based on the alignment
         self._align_pos(align)
@@ -62,13 +288,14 @@ class Text:
     @classmethod
     def set_cache(cls,new_limit: int) -> None:
         """
-        Set the maximum number of cached surfaces.
-        Note: Default is 10000, but can be increased or decreased as needed.
+        Set the maximum memory of the cached surfaces in bytes.
+        Note: Default is 64 MiB, but can be increased or decreased as needed.
 
         Args:
-            new_limit (int): New cache size limit.
+            new_limit (int): New cache size limit in bytes.
         """
         cls._cache_limit = new_limit
+        cls.__evict(0)
 
     @classmethod
     def get_cache(cls) -> int:
@@ -80,37 +307,96 @@ class Text:
         """
         return len(cls.surfaces)
 
+    @classmethod
+    def get_cache_stats(cls) -> dict:
+        """
+        Get the statistics of the surfaces cache.
+
+        Returns:
+            dict: The hits, misses and evictions counters, the hit rate,
+                the number of cached surfaces and their memory (and limit) in bytes.
+        """
+        stats = cls._cache_stats
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            **stats,
+            "hit_rate": stats["hits"] / lookups if lookups else 0,
+            "entries": len(cls.surfaces),
+            "memory": cls._cache_memory,
+            "limit": cls._cache_limit
+        }
+
     @classmethod
     def clear_cache(cls) -> None:
         """
-        Clear all cached text surfaces.
+        Clear all cached text surfaces and glyph atlases, and reset the cache statistics.
         """
         cls.surfaces.clear()
+        cls._cache_memory = 0
+        cls._cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        GlyphAtlas.atlases.clear()
 
     @classmethod
-    def font_size_for(cls,text: str, size: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3, font_name: str) -> int:
+    def font_size_for(cls,text: str, size: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3, font_name: str, wrap: bool = False, max_size: int = 256) -> int:
         """
         Calculates the largest font size that fits the text inside a given area.
 
+        The sizes are binary searched and only measured, nothing is rendered.
+
         Args:
             text (str): Text to render.
             size (size: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3): The size of the text.
             font_name (str): Name of the cache font.
+            wrap (bool): Word wrap the text to the width of the area. Defaults to False.
+            max_size (int): The largest font size to try. Defaults to 256.
 
         Returns:
-            int: Maximum font size that fits.
+            int: Maximum font size that fits, 0 if not even size 1 fits.
         """
         width,height = size[0],size[1]
-        font_type = "sys" if font_name.lower() in pygame.font.get_fonts() else "local"
-        for font_size in text_sizes:
-            font = cls.__get_font(font_name, font_size)
-            text_surface = font.render(text, True, (0, 0, 0))
-            text_width, text_height = text_surface.get_size()
-
+        low,high = 0,max_size
+        while low < high:
+            font_size = (low + high + 1) // 2
+            text_width,text_height = cls.measure(text,font_name,font_size,width if wrap else None)
             if text_width > width or text_height > height:
-                return font_size - 1
+                high = font_size - 1
+            else:
+                low = font_size
+        return low
+
+    @classmethod
+    def measure(cls,text: str,font_name: str,size: int,max_width: int | None = None) -> Tuple[int, int]:
+        """
+        Calculates the size of a text without rendering it.
+
+        Args:
+            text (str): The text to measure.
+            font_name (str): The text font name.
+            size (int): Font size.
+            max_width (int, optional): Word wrap the text to this width in pixels.
+
+        Returns:
+            Tuple[int, int]: The (width, height) the rendered text would have.
+        """
+        font = cls.__get_family(font_name).get(size)
+        lines = _wrap(text,font,max_width)
+        return cls.__measure_lines(font,lines)
+
+    @classmethod
+    def wrap(cls,text: str,font_name: str,size: int,max_width: int) -> Tuple[str, ...]:
+        """
+        Breaks a text into lines that fit a width (cached per text, font and width).
 
-        return font_size
+        Args:
+            text (str): The text to wrap.
+            font_name (str): The text font name.
+            size (int): Font size.
+            max_width (int): The maximum line width in pixels.
+
+        Returns:
+            Tuple[str, ...]: The lines of the text.
+        """
+        return _wrap(text,cls.__get_family(font_name).get(size),max_width)
 
     @property
     def position(self) -> pygame.math.Vector2 | pygame.math.Vector3:
@@ -132,6 +418,16 @@ class Text:
         """
         return self._text
 
+    @property
+    def lines(self) -> Tuple[str, ...]:
+        """
+        Get the laid out lines of the text.
+
+        Returns:
+            Tuple[str, ...]: The lines of the text.
+        """
+        return self._lines
+
     @property
     def color(self) -> str | tuple:
         """
@@ -193,9 +489,27 @@ class Text:
         Returns:
             int: The memory size of the text surface.
         """
-        bytes_per_pixel = self._surface.get_bytesize()
+        return self._get_memory(self._surface)
+
+    def set_text(self,text: str) -> None:
+        """
+        Changes the value of the text, keeping its alignment.
+
+        Note: Reuse one Text object for a value that changes every frame instead of creating a new one.
+
+        Args:
+            text (str): The new string to render.
+        """
+        if text == self._text:
+            return
+
+        old_width,old_height = self._surface.get_size()
+        self._text = text
+        self.__update_surface()
+
         width,height = self._surface.get_size()
-        return width * height * bytes_per_pixel
+        self._align_pos(self._align,(width - old_width,height - old_height))
+        self._index and self._index.update(self)
 
     def move(self,pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3) -> None:
         """
@@ -207,6 +521,7 @@ class Text:
         """
         self._pos.x += pos[0]
         self._pos.y += pos[1]
+        self._index and self._index.update(self)
 
     def move_at(self,pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3) -> None:
         """
@@ -218,8 +533,9 @@ class Text:
         """
         self._pos.x = pos[0]
         self._pos.y = pos[1]
+        self._index and self._index.update(self)
 
-    def draw(self,surf: pygame.Surface,scale: float) -> None:
+    def draw(self,surf: pygame.Surface,scale: float,pos: Tuple[int | float, int | float] | None = None) -> pygame.Rect:
         """
         Draws the text on the given surface.
 
@@ -228,52 +544,163 @@ class Text:
                 The surface to draw the text on.
             scale (float):
                 The scale factor to apply to the text.
+            pos (Tuple[int | float, int | float], optional):
+                The screen position to draw at. Defaults to the text position.
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
         """
-        zoom = scale
-        if zoom == 1:
-            surf.blit(self._surface, self._pos)
-            return
-        if not self._zoom == zoom:
-            self._zoom_surface = pygame.transform.scale_by(self._surface, zoom)
-            self._zoom = zoom
-        surf.blit(self._zoom_surface, self._pos)
+        return surf.blit(self._get_surface(scale), self._pos if pos is None else pos)
 
-    def _cache_surface(self) -> None:
+    def _get_surface(self,scale: float) -> pygame.Surface:
         """
-        Caches the rendered text surface for future use.
+        Returns the text surface for the given scale.
 
-        This method ensures that the text surface is only rendered once and stored in a cache.
-        If the cache limit is reached, the oldest cached surface is removed to make room for the new one.
+        A zoomed text is rendered again at the effective font size (sharp instead of stretched),
+        from the shared surfaces cache, so every text with the same string, font and color shares it.
+
+        Args:
+            scale (float):
+                The scale factor to apply to the text.
+
+        Returns:
+            pygame.Surface: The (zoomed) text surface.
         """
-        self._surface = self._font.render(self._text, False, self._color)
+        size = max(1,round(self._size * scale))
+        if size == self._size:
+            return self._surface
+        return self._get_cached(self._family.get(size),self._lines,self._color,self._rgba)
 
-        if len(self.surfaces) >= self._cache_limit:
-            self.surfaces and self.surfaces.popitem(last=True)
+    @classmethod
+    def _get_cached(cls,font: pygame.font.Font,lines: Tuple[str, ...],color: str | tuple,rgba: Tuple[int, int, int, int]) -> pygame.Surface:
+        """
+        Returns a rendered text surface from the surfaces cache, rendering it on a miss.
 
-        self.surfaces[(self._font,self._text)] = self._surface
+        Args:
+            font (pygame.font.Font): The font to render with.
+            lines (Tuple[str, ...]): The laid out lines of the text.
+            color (str or tuple): The color of the text.
+            rgba (Tuple[int, int, int, int]): The resolved color, part of the cache key.
 
-    def _align_pos(self,align: str) -> None:
+        Returns:
+            pygame.Surface: The text surface.
+        """
+        key = (font,lines,rgba)
+        surface = cls.surfaces.get(key)
+        if surface is None:
+            cls._cache_stats["misses"] += 1
+            # the lines are joined with new lines, so a paragraph is rendered in one surface
+            surface = font.render("\n".join(lines), False, color)
+            cls._cache_surface(key,surface)
+            return surface
+
+        cls._cache_stats["hits"] += 1
+        cls.surfaces.move_to_end(key)
+        return surface
+
+    @classmethod
+    def _cache_surface(cls,key: tuple,surface: pygame.Surface) -> None:
+        """
+        Caches a rendered text surface for future use.
+
+        If the cache memory limit is reached, the least recently used surfaces are removed to make room for the new one.
+
+        Args:
+            key (tuple): The cache key (font, lines, color).
+            surface (pygame.Surface): The rendered surface.
+        """
+        memory = cls._get_memory(surface)
+        if memory > cls._cache_limit:
+            return  # larger than the whole cache, keep it only in the object
+        cls.__evict(memory)
+
+        cls.surfaces[key] = surface
+        cls._cache_memory += memory
+
+    @staticmethod
+    def _get_memory(surface: pygame.Surface) -> int:
+        """
+        Returns the memory size of a surface in bytes.
+
+        Args:
+            surface (pygame.Surface): The surface.
+
+        Returns:
+            int: The memory size of the surface.
+        """
+        bytes_per_pixel = surface.get_bytesize()
+        width,height = surface.get_size()
+        return width * height * bytes_per_pixel
+
+    @classmethod
+    def __evict(cls,memory: int) -> None:
+        """
+        Removes the least recently used surfaces until the given bytes fit in the cache.
+
+        Args:
+            memory (int): The bytes to make room for.
+        """
+        surfaces = cls.surfaces
+        while surfaces and cls._cache_memory + memory > cls._cache_limit:
+            _,surface = surfaces.popitem(last=False)
+            cls._cache_memory -= cls._get_memory(surface)
+            cls._cache_stats["evictions"] += 1
+
+    def _align_pos(self,align: str,size: Tuple[int, int] | None = None) -> None:
         """
         Adjust the text position based on the specified alignment.
 
         Args:
             align (str): "left", "center", or "right".
+            size (Tuple[int, int], optional): The size to align by. Defaults to the size of the text,
+                set_text passes the change of the size to realign the text.
         """
         # the text is left aligned by default
         if align == "left":
             return
 
-        rect = self.rect
+        width,height = self._surface.get_size() if size is None else size
         if align == "center":
-            self._pos.x -= rect.width / 2
-            self._pos.y -= rect.height / 2
+            self._pos.x -= width / 2
+            self._pos.y -= height / 2
         elif align == "right":
-            self._pos.x += rect.width / 2
+            self._pos.x += width / 2
         else:
             raise ValueError(f"Invalid alignment: {align}")
 
+    def __update_surface(self) -> None:
+        """Updates the surface for the current text, from the glyph atlas or the surfaces cache."""
+        self._lines = _wrap(self._text,self._font,self._max_width)
+        if self._atlas:
+            self.__assemble()
+            return
+        self._surface = self._get_cached(self._font,self._lines,self._color,self._rgba)
+
+    def __assemble(self) -> None:
+        """Assembles the text from the glyph atlas into the reused buffer surface."""
+        atlas = self._atlas
+        lines = [atlas.glyphs(line) for line in self._lines]
+        line_height = atlas.height
+        width = max(sum(area.width for area in areas) for areas in lines)
+        height = line_height * len(lines)
+
+        buffer = self._buffer
+        if buffer is None or buffer.get_width() < width or buffer.get_height() < height:
+            # grow in steps, so a changing value rarely allocates a new buffer
+            buffer = self._buffer = atlas.surface((max(width,1) * 2,height))
+
+        len(lines) > 1 and atlas.clear(buffer,(0,0,width,height))  # the lines have different widths
+        for y,areas in enumerate(lines):
+            atlas.render(buffer,areas,(0,y * line_height))
+        self._surface = buffer.subsurface((0,0,width,height))
+
+    @staticmethod
+    def __measure_lines(font: pygame.font.Font, lines: Tuple[str, ...]) -> Tuple[int, int]:
+        """Returns the size of rendered lines, using the font metrics."""
+        return (max(font.size(line)[0] for line in lines), font.get_linesize() * len(lines))
+
     @staticmethod
-    def __get_font(font_name: str, size: int) -> pygame.font.Font:
+    def __get_family(font_name: str) -> Font:
         """
         Retrieves the font from the assets.
 
@@ -281,27 +708,9 @@ class Text:
             font_name (str): The name of the font.
 
         Returns:
-            pygame.font.Font: The font object.
+            Font: The font, with its sizes loaded on first use.
         """
         font = Assets.get("data","fonts",font_name) or Assets.get("engine","fonts",font_name)
         if not font:
             raise ValueError(f"Font '{font_name}' not found.")
-        return font.get(size)
-
-    @staticmethod
-    def __fix_size(size: int) -> int:
-        """
-        Returns the closest supported font size from the default set.
-
-        Args:
-            size (int): The requested font size.
-
-        Returns:
-            int: The closest allowed font size.
-        """
-        closest = min(text_sizes, key=lambda s: abs(s - size))
-
-        if closest != size:
-            engine.warning(f"Font size {size} not available. Using closest: {closest}")
-            return closest
-        return size
+        return font
@@ -0,0 +1,233 @@
+from .functions import vector
+from ..assets import Assets
+
+from math import floor
+from typing import Dict,List,Sequence,Tuple
+
+import pygame
+
+class Tilemap:
+    """
+    A grid of tiles drawn from a tileset, baked into fixed-size chunk surfaces.
+
+    Every chunk is rendered once into its own surface and only re-baked when one of its tiles changes.
+    Drawing blits only the chunks inside the view (scaled through `Assets.get_scaled` when zoomed),
+    so the draw cost depends on the screen size and not on the size of the map.
+    """
+
+    def __init__(
+            self,
+            tileset: pygame.Surface,
+            tile_size: Tuple[int, int],
+            tiles: Sequence[Sequence[int]],
+            pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3 = (0, 0),
+            chunk_size: int = 16
+    ) -> None:
+        """
+        Initializes a Tilemap object.
+
+        Args:
+            tileset (pygame.Surface): The tileset surface, tiles are indexed left to right and top to bottom.
+            tile_size (Tuple[int, int]): The size of a tile in pixels (width, height).
+            tiles (Sequence[Sequence[int]]): The tile indices by row, negative values are empty tiles.
+            pos (Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3): The position of the map. Default = (0, 0)
+            chunk_size (int): The width and height of a chunk in tiles. Default = 16
+        """
+        self._pos = vector(*pos)
+        self._index = None  # the SpatialHash the object is registered to
+        self._tile_size = tuple(tile_size)
+        self._chunk_size = chunk_size
+        self._tileset = self.__split_tileset(tileset, self._tile_size)
+        self._tiles: List[List[int]] = [list(row) for row in tiles]
+        self._chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._version = 0  # changes with every tile edit
+
+        rows = len(self._tiles)
+        columns = len(self._tiles[0]) if rows else 0
+        self._grid = (columns, rows)
+        self._chunk_grid = (-(-columns // chunk_size), -(-rows // chunk_size))
+
+    @property
+    def position(self) -> pygame.math.Vector2 | pygame.math.Vector3:
+        """
+        Get a copy of the position of the map.
+
+        Returns:
+            pygame.math.Vector2 or pygame.math.Vector3: The position of the map.
+        """
+        return self._pos.copy()
+
+    @property
+    def grid(self) -> Tuple[int, int]:
+        """
+        Get the size of the map in tiles.
+
+        Returns:
+            Tuple[int, int]: The (columns, rows) of the map.
+        """
+        return self._grid
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """
+        Get the size of the map in pixels.
+
+        Returns:
+            Tuple[int, int]: The (width, height) of the map.
+        """
+        return (self._grid[0] * self._tile_size[0], self._grid[1] * self._tile_size[1])
+
+    @property
+    def rect(self) -> pygame.FRect:
+        """
+        Returns the rectangle of the whole map.
+
+        Returns:
+            pygame.FRect: The rectangle of the map.
+        """
+        return pygame.FRect(self._pos, self.size)
+
+    @property
+    def memory(self) -> int:
+        """
+        Returns the memory size of the baked chunks in bytes.
+
+        Returns:
+            int: The memory size of the chunk surfaces.
+        """
+        return sum(
+            chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+            for chunk in self._chunks.values()
+        )
+
+    def get_tile(self, x: int, y: int) -> int:
+        """
+        Get the tile index at a grid position.
+
+        Args:
+            x (int): The column of the tile.
+            y (int): The row of the tile.
+
+        Returns:
+            int: The tile index.
+        """
+        return self._tiles[y][x]
+
+    def set_tile(self, x: int, y: int, index: int) -> None:
+        """
+        Change the tile at a grid position, only its chunk will be re-baked.
+
+        Args:
+            x (int): The column of the tile.
+            y (int): The row of the tile.
+            index (int): The new tile index, negative values are empty tiles.
+        """
+        if self._tiles[y][x] == index:
+            return
+        self._tiles[y][x] = index
+        self._chunks.pop((x // self._chunk_size, y // self._chunk_size), None)
+        self._version += 1
+
+    def move(self,pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3) -> None:
+        """
+        Moves the map by the given offset.
+
+        Args:
+            pos (Tuple[int | float, int | float] | Vector2 | Vector3):
+                The amount to move the map by, relative to its current position.
+        """
+        self._pos.x += pos[0]
+        self._pos.y += pos[1]
+        self._index and self._index.update(self)
+
+    def move_at(self,pos: Tuple[int | float, int | float] | pygame.math.Vector2 | pygame.math.Vector3) -> None:
+        """
+        Moves the map to a position.
+
+        Args:
+            pos (Tuple[int | float, int | float] | Vector2 | Vector3):
+                The new position for the map.
+        """
+        self._pos.x = pos[0]
+        self._pos.y = pos[1]
+        self._index and self._index.update(self)
+
+    def draw(self,surf: pygame.Surface,scale: float,pos: Tuple[int | float, int | float] | None = None) -> pygame.Rect:
+        """
+        Draws the chunks of the map that are inside the surface.
+
+        Args:
+            surf (pygame.Surface):
+                The surface to draw the map on.
+            scale (float):
+                The scale factor to apply to the map.
+            pos (Tuple[int | float, int | float], optional):
+                The screen position to draw at. Defaults to the map position.
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
+        """
+        x, y = (self._pos.x, self._pos.y) if pos is None else pos
+        chunk_width = self._chunk_size * self._tile_size[0] * scale
+        chunk_height = self._chunk_size * self._tile_size[1] * scale
+        columns, rows = self._chunk_grid
+        area = surf.get_clip()
+
+        # the range of chunks inside the surface
+        first_x = max(0, floor((area.left - x) / chunk_width))
+        first_y = max(0, floor((area.top - y) / chunk_height))
+        last_x = min(columns - 1, floor((area.right - x) / chunk_width))
+        last_y = min(rows - 1, floor((area.bottom - y) / chunk_height))
+
+        blits = [
+            (
+                Assets.get_scaled(self.__get_chunk(cx, cy), scale),
+                (round(x + cx * chunk_width), round(y + cy * chunk_height))
+            )
+            for cy in range(first_y, last_y + 1)
+            for cx in range(first_x, last_x + 1)
+        ]
+        surf.fblits(blits)
+
+        if not blits:
+            return pygame.Rect(x, y, 0, 0)
+        drawn = pygame.Rect(blits[0][1], (0, 0))
+        return drawn.unionall([chunk.get_rect(topleft=dest) for chunk, dest in blits])
+
+    def __get_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        """Returns the baked surface of a chunk, baking it on first use."""
+        chunk = self._chunks.get((cx, cy))
+        if chunk is None:
+            chunk = self._chunks[(cx, cy)] = self.__bake_chunk(cx, cy)
+        return chunk
+
+    def __bake_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        """Renders all the tiles of a chunk into a new surface."""
+        size = self._chunk_size
+        tile_width, tile_height = self._tile_size
+        columns, rows = self._grid
+        tileset = self._tileset
+
+        # the chunks at the edges of the map may be smaller
+        first_x, first_y = cx * size, cy * size
+        last_x, last_y = min(first_x + size, columns), min(first_y + size, rows)
+
+        chunk = pygame.Surface(((last_x - first_x) * tile_width, (last_y - first_y) * tile_height), pygame.SRCALPHA)
+        chunk.fblits([
+            (tileset[index], ((x - first_x) * tile_width, (y - first_y) * tile_height))
+            for y in range(first_y, last_y)
+            for x, index in enumerate(self._tiles[y][first_x:last_x], first_x)
+            if 0 <= index < len(tileset)
+        ])
+        return chunk
+
+    @staticmethod
+    def __split_tileset(tileset: pygame.Surface, tile_size: Tuple[int, int]) -> List[pygame.Surface]:
+        """Splits the tileset into tile subsurfaces, left to right and top to bottom."""
+        tile_width, tile_height = tile_size
+        width, height = tileset.get_size()
+        return [
+            tileset.subsurface((x, y, tile_width, tile_height))
+            for y in range(0, height - tile_height + 1, tile_height)
+            for x in range(0, width - tile_width + 1, tile_width)
+        ]